@@ -4,6 +4,7 @@ SQLite database module for storing snow depth measurements.
 
 import sqlite3
 import os
+import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
@@ -25,6 +26,13 @@ def _convert_numpy_types(obj):
     return obj
 
 
+# SQL for the file name part of a path (everything after the last '/')
+_IMAGE_BASENAME_SQL = "substr({0}, length(rtrim({0}, replace({0}, '/', ''))) + 1)"
+
+# Generated columns need SQLite 3.31+; Python 3.8 builds often link an older one
+_HAS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+
+
 class SnowDatabase:
     """Manages SQLite database for snow depth measurements."""
 
@@ -40,13 +48,23 @@ class SnowDatabase:
                 'snow_measurements.db'
             )
         self.db_path = db_path
+        self._local = threading.local()
         self._init_database()
 
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
+        batch_conn = getattr(self._local, 'batch_conn', None)
+        if batch_conn is not None:
+            # Inside batch(): share its connection and leave committing to it
+            yield batch_conn
+            return
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # The database runs in WAL mode (set in _init_database), where NORMAL
+        # is still crash-safe and skips an fsync on every commit
+        conn.execute('PRAGMA synchronous=NORMAL')
         try:
             yield conn
             conn.commit()
@@ -56,9 +74,70 @@ class SnowDatabase:
         finally:
             conn.close()
 
+    @contextmanager
+    def batch(self):
+        """Run several calls on one connection, committed as a single transaction.
+
+        Example:
+            with db.batch():
+                db.delete_measurement(old_id)
+                db.insert_measurement(...)
+        """
+        with self._get_connection() as conn:
+            # Take the write lock up front rather than upgrading part way through
+            conn.execute('BEGIN IMMEDIATE')
+            self._local.batch_conn = conn
+            try:
+                yield self
+            finally:
+                self._local.batch_conn = None
+
+    @contextmanager
+    def savepoint(self):
+        """Inside batch(), undo the block's writes if it raises, keeping the rest.
+
+        Example:
+            with db.batch():
+                for ...:
+                    try:
+                        with db.savepoint():
+                            db.delete_measurement(old_id)
+                            db.insert_measurement(...)
+                    except Exception:
+                        pass  # This row is unchanged; the others still commit
+
+        Outside batch() every call commits or rolls back on its own, so this
+        does nothing there.
+        """
+        conn = getattr(self._local, 'batch_conn', None)
+        if conn is None:
+            yield self
+            return
+
+        conn.execute('SAVEPOINT row')
+        try:
+            yield self
+        except BaseException:
+            conn.execute('ROLLBACK TO row')
+            conn.execute('RELEASE row')
+            raise
+        conn.execute('RELEASE row')
+
+    @staticmethod
+    def _column_names(cursor, table):
+        """Names of a table's columns, including generated ones."""
+        try:
+            rows = cursor.execute(f"PRAGMA table_xinfo({table})").fetchall()
+        except sqlite3.OperationalError:
+            # table_xinfo needs SQLite 3.26+; older versions have no generated columns
+            rows = cursor.execute(f"PRAGMA table_info({table})").fetchall()
+        return {row['name'] for row in rows}
+
     def _init_database(self):
         """Create database tables if they don't exist."""
         with self._get_connection() as conn:
+            # Persistent: readers no longer block on writers (and vice versa)
+            conn.execute('PRAGMA journal_mode=WAL')
             cursor = conn.cursor()
 
             # Main measurements table
@@ -123,6 +202,40 @@ class SnowDatabase:
             except:
                 pass  # Columns already exist
 
+            # Image filename without its directory (image_path is stored bare,
+            # under /out/ or as an absolute path)
+            if 'image_basename' not in self._column_names(cursor, 'snow_measurements'):
+                if _HAS_GENERATED_COLUMNS:
+                    # Kept by SQLite itself
+                    cursor.execute(f"""
+                        ALTER TABLE snow_measurements ADD COLUMN image_basename TEXT
+                        GENERATED ALWAYS AS ({_IMAGE_BASENAME_SQL.format('image_path')}) VIRTUAL
+                    """)
+                else:
+                    # Older SQLite: a plain column, backfilled here and kept up
+                    # to date by triggers so every writer fills it in
+                    cursor.execute("ALTER TABLE snow_measurements ADD COLUMN image_basename TEXT")
+                    cursor.execute(f"""
+                        UPDATE snow_measurements
+                        SET image_basename = {_IMAGE_BASENAME_SQL.format('image_path')}
+                    """)
+                    for name, event in (('insert', 'INSERT'), ('update', 'UPDATE OF image_path')):
+                        cursor.execute(f"""
+                            CREATE TRIGGER IF NOT EXISTS snow_measurements_image_basename_{name}
+                            AFTER {event} ON snow_measurements
+                            BEGIN
+                                UPDATE snow_measurements
+                                SET image_basename = {_IMAGE_BASENAME_SQL.format('NEW.image_path')}
+                                WHERE id = NEW.id;
+                            END
+                        """)
+
+            # Index for looking up a measurement by its image (frontend image serving)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_resort_image_basename
+                ON snow_measurements(resort, image_basename)
+            """)
+
             # Daily auto-calibration table - stores detected calibration values per day
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS daily_calibrations (
@@ -308,18 +421,17 @@ class SnowDatabase:
 
             # Also insert individual samples into the samples table
             if sample_data:
-                for sample in sample_data:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO measurement_samples
-                        (measurement_id, sample_index, x_position, snow_line_y, depth_inches)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        measurement_id,
-                        sample.get('sample_index'),
-                        sample.get('x_position'),
-                        sample.get('snow_line_y'),
-                        sample.get('depth_inches')
-                    ))
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO measurement_samples
+                    (measurement_id, sample_index, x_position, snow_line_y, depth_inches)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(
+                    measurement_id,
+                    sample.get('sample_index'),
+                    sample.get('x_position'),
+                    sample.get('snow_line_y'),
+                    sample.get('depth_inches')
+                ) for sample in sample_data])
 
             return measurement_id
 
@@ -650,6 +762,39 @@ class SnowDatabase:
 
             return results
 
+    def get_calibration_timeline(
+        self,
+        resort: str
+    ) -> List[Dict[str, Any]]:
+        """Get every calibration version for a resort, oldest first.
+
+        Ordered by (effective_from, id), so callers can bisect on
+        effective_from instead of calling get_calibration_for_timestamp()
+        once per timestamp.
+
+        Args:
+            resort: Resort name
+
+        Returns:
+            List of dicts with effective_from, effective_to and config
+        """
+        import json
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT effective_from, effective_to, config_json
+                FROM calibration_versions
+                WHERE resort = ?
+                ORDER BY effective_from, id
+            """, (resort,))
+
+            return [{
+                'effective_from': row['effective_from'],
+                'effective_to': row['effective_to'],
+                'config': json.loads(row['config_json'])
+            } for row in cursor.fetchall()]
+
     def get_current_calibration_version(
         self,
         resort: str
@@ -6,14 +6,38 @@ Displays images with calibration overlays and estimated snow levels.
 
 import os
 import sys
+import bisect
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import itertools
 import json
+import multiprocessing
+import queue
+import re
 import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from flask import Flask, render_template_string, send_file, request, jsonify
+from flask import Flask, Response, stream_template, stream_with_context, request, jsonify, send_file
 import cv2
 import numpy as np
-from io import BytesIO
+
+# libjpeg-turbo's SIMD encoder is much faster than OpenCV's for the image
+# responses; fall back to cv2.imencode when it (or its shared library) is missing
+HAS_TURBOJPEG = False
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    _turbojpeg = TurboJPEG()
+    HAS_TURBOJPEG = True
+except (ImportError, OSError, RuntimeError):
+    pass
 
 
 def _convert_numpy_types(obj):
@@ -37,14 +61,17 @@ app = Flask(__name__)
 OUT_DIR = os.environ.get('OUT_DIR', '/out')
 DB_PATH = os.environ.get('DB_PATH', '/out/snow_measurements.db')
 CONFIG_PATH = os.environ.get('CONFIG_PATH', '/out/resort_calibrations.json')
+RENDER_CACHE_DIR = os.environ.get('RENDER_CACHE_DIR',
+                                  os.path.join(tempfile.gettempdir(), 'snowcam_render_cache'))
 
-# HTML Template
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Snow Depth Measurements</title>
-    <style>
+# Capture time embedded in image filenames (e.g., winter_park_20251127_230039.jpg),
+# stored as UTC; the overlay shows it as MST (UTC-7)
+_TS_RE = re.compile(r'(\d{8})_(\d{6})')
+_MST_OFFSET = timedelta(hours=7)
+
+# Static page fragments. These never change per request, so they are built once
+# at import time and injected verbatim instead of being re-rendered by Jinja.
+STATIC_CSS = '''
         * { box-sizing: border-box; margin: 0; padding: 0; }
         body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
@@ -104,6 +131,20 @@ HTML_TEMPLATE = '''
             width: 100%;
             border-radius: 5px;
         }
+        /* Grid/region/stake/base overlays, drawn over the image as SVG */
+        .overlay-layer {
+            position: absolute;
+            top: 15px;
+            left: 15px;
+            right: 15px;
+            pointer-events: none;
+        }
+        .overlay-layer svg { display: block; width: 100%; height: auto; }
+        .overlay-layer .layer { display: none; }
+        .overlay-layer.show-grid .grid,
+        .overlay-layer.show-regions .regions,
+        .overlay-layer.show-stake .stake,
+        .overlay-layer.show-base .base { display: inline; }
         .measurement-overlay {
             position: absolute;
             top: 25px;
@@ -584,6 +625,102 @@ HTML_TEMPLATE = '''
         .sample-table td.valid { color: #00ff88; }
         .sample-table td.invalid { color: #ff6666; }
         .sample-table td.skip { color: #ff9944; font-size: 10px; }
+        .sample-table tr.sample-summary { border-top: 2px solid #0f3460; background: #1a1a2e; }
+        .sample-table td.summary-label { text-align: right; font-weight: bold; }
+        .sample-table td.summary-avg { color: #4ade80; font-weight: bold; }
+        .sample-table td.summary-avg-low { color: #f87171; font-weight: bold; }
+        .sample-table td.summary-threshold { color: #f87171; font-size: 10px; }
+        .sample-table td.summary-empty { color: #888; }
+        .sample-table td.delta-pos { color: #4ade80; }
+        .sample-table td.delta-neg { color: #f87171; }
+        .stat-row.accumulation { background: #1a3a1a; border-radius: 5px; padding: 5px; }
+        .stat-row.accumulation .stat-label { font-weight: bold; }
+        .stat-row.accumulation .stat-value { color: #4ade80; font-size: 1.2em; }
+        .hourly-breakdown { margin-top: 10px; }
+        .hourly-breakdown summary { cursor: pointer; color: #e94560; }
+        .hourly-breakdown .sample-table { margin-top: 5px; font-size: 12px; }
+'''
+
+CAL_PROPERTY_GROUPS = [
+    ('Stake Corners (click to set X,Y)', [
+        ('stake_corners.top_left', 'Top Left Corner'),
+        ('stake_corners.top_right', 'Top Right Corner'),
+        ('stake_corners.bottom_left', 'Bottom Left Corner'),
+        ('stake_corners.bottom_right', 'Bottom Right Corner'),
+    ]),
+    ('Stake Axis (click to set X,Y)', [
+        ('stake_axis.top', 'Axis Top (18" end)'),
+        ('stake_axis.bottom', 'Axis Bottom (0" end)'),
+    ]),
+    ('Snow Stake Base (click to set X,Y)', [
+        ('sample_bounds.top_left', 'Base Top Left'),
+        ('sample_bounds.top_right', 'Base Top Right'),
+        ('sample_bounds.bottom_left', 'Base Bottom Left'),
+        ('sample_bounds.bottom_right', 'Base Bottom Right'),
+    ]),
+    ('Camera', [
+        ('camera_tilt', 'Camera Tilt (degrees)'),
+    ]),
+    ('Marker Positions (Y only)', [
+        (f'marker_positions.{i}', f'{i}" Marker Y') for i in range(0, 19, 2)
+    ]),
+    ('Other', [
+        ('min_depth_threshold', 'Min Depth Threshold'),
+    ]),
+]
+
+CAL_SELECT_HTML = (
+    '<select id="cal-property">\n'
+    '            <option value="">-- Select Property --</option>\n'
+    + ''.join(
+        f'            <optgroup label="{label}">\n'
+        + ''.join(f'                <option value="{value}">{text}</option>\n'
+                  for value, text in options)
+        + '            </optgroup>\n'
+        for label, options in CAL_PROPERTY_GROUPS
+    )
+    + '        </select>'
+)
+
+REMEASURE_MODES = [
+    ('since_calibration', 'Since Last Calibration'),
+    ('last_n_days', 'Last N Days'),
+    ('date_range', 'Custom Date Range'),
+    ('all', 'All Measurements'),
+]
+
+REMEASURE_MODE_HTML = (
+    '<select id="remeasure-mode" onchange="updateRemeasurePreview()">\n'
+    + ''.join(f'                <option value="{value}">{text}</option>\n'
+              for value, text in REMEASURE_MODES)
+    + '            </select>'
+)
+
+# Calibration points shown in the status checklist, as (key, label)
+CALIBRATION_POINTS = [
+    ('stake_corners.top_left', 'Stake TL'),
+    ('stake_corners.top_right', 'Stake TR'),
+    ('stake_corners.bottom_left', 'Stake BL'),
+    ('stake_corners.bottom_right', 'Stake BR'),
+    ('sample_bounds.top_left', 'Sample TL'),
+    ('sample_bounds.top_right', 'Sample TR'),
+    ('sample_bounds.bottom_left', 'Sample BL'),
+    ('sample_bounds.bottom_right', 'Sample BR'),
+    ('stake_axis.top', 'Axis Top'),
+    ('stake_axis.bottom', 'Axis Bot'),
+] + [(f'marker_positions.{i}', f'{i}"') for i in range(0, 19, 2)]
+
+# CALIBRATION_POINTS with each dotted key pre-split into its path parts
+_CALIBRATION_POINT_PATHS = [(key, label, tuple(key.split('.'))) for key, label in CALIBRATION_POINTS]
+
+# HTML Template
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Snow Depth Measurements</title>
+    <style>
+{{ static_css|safe }}
     </style>
 </head>
 <body>
@@ -607,7 +744,8 @@ HTML_TEMPLATE = '''
     <div class="main-content">
         <div class="image-section">
             <div class="image-container">
-                <img id="main-image" src="/image/{{ resort }}/{{ current_image }}" alt="Snow measurement">
+                <img id="main-image" src="/image/{{ resort }}/{{ current_image }}" alt="Snow measurement" decoding="async">
+                <div id="overlay-layer" class="overlay-layer"></div>
                 <div class="measurement-overlay">
                     <div class="measurement-id" id="measurement-id">ID: {{ current_id }}</div>
                     <div class="measurement-value" id="depth-value">{{ current_depth }}</div>
@@ -691,10 +829,9 @@ HTML_TEMPLATE = '''
                 <h3>🕐 Hourly Timeline</h3>
                 <div class="timeline" id="timeline">
                     {% for m in measurements %}
-                    <div class="timeline-item {{ m.class }}"
+                    <div class="timeline-item {{ m.class }}{% if loop.index0 == current_index %} active{% endif %}"
                          onclick="selectMeasurement({{ loop.index0 }})"
-                         title="{{ m.time }}: {{ m.depth }}"
-                         {% if loop.index0 == current_index %}style="border: 2px solid #fff;"{% endif %}>
+                         title="{{ m.time }}: {{ m.depth }}">
                         {{ m.hour }}
                     </div>
                     {% endfor %}
@@ -712,6 +849,9 @@ HTML_TEMPLATE = '''
                             <tr><td colspan="4" style="color:#888">Loading...</td></tr>
                         </tbody>
                     </table>
+                    <template id="sample-row-tpl">
+                        <tr><td></td><td class="depth"></td><td class="contrast"></td><td></td></tr>
+                    </template>
                 </div>
             </div>
 
@@ -754,43 +894,7 @@ HTML_TEMPLATE = '''
         </div>
 
         <label>Property to Set</label>
-        <select id="cal-property">
-            <option value="">-- Select Property --</option>
-            <optgroup label="Stake Corners (click to set X,Y)">
-                <option value="stake_corners.top_left">Top Left Corner</option>
-                <option value="stake_corners.top_right">Top Right Corner</option>
-                <option value="stake_corners.bottom_left">Bottom Left Corner</option>
-                <option value="stake_corners.bottom_right">Bottom Right Corner</option>
-            </optgroup>
-            <optgroup label="Stake Axis (click to set X,Y)">
-                <option value="stake_axis.top">Axis Top (18" end)</option>
-                <option value="stake_axis.bottom">Axis Bottom (0" end)</option>
-            </optgroup>
-            <optgroup label="Snow Stake Base (click to set X,Y)">
-                <option value="sample_bounds.top_left">Base Top Left</option>
-                <option value="sample_bounds.top_right">Base Top Right</option>
-                <option value="sample_bounds.bottom_left">Base Bottom Left</option>
-                <option value="sample_bounds.bottom_right">Base Bottom Right</option>
-            </optgroup>
-            <optgroup label="Camera">
-                <option value="camera_tilt">Camera Tilt (degrees)</option>
-            </optgroup>
-            <optgroup label="Marker Positions (Y only)">
-                <option value="marker_positions.0">0" Marker Y</option>
-                <option value="marker_positions.2">2" Marker Y</option>
-                <option value="marker_positions.4">4" Marker Y</option>
-                <option value="marker_positions.6">6" Marker Y</option>
-                <option value="marker_positions.8">8" Marker Y</option>
-                <option value="marker_positions.10">10" Marker Y</option>
-                <option value="marker_positions.12">12" Marker Y</option>
-                <option value="marker_positions.14">14" Marker Y</option>
-                <option value="marker_positions.16">16" Marker Y</option>
-                <option value="marker_positions.18">18" Marker Y</option>
-            </optgroup>
-            <optgroup label="Other">
-                <option value="min_depth_threshold">Min Depth Threshold</option>
-            </optgroup>
-        </select>
+        {{ cal_select_html|safe }}
 
         <div class="coord-display">
             <div class="coords" id="cal-coords">Click image</div>
@@ -818,12 +922,7 @@ HTML_TEMPLATE = '''
             <h2>Re-measure Snow Depths</h2>
 
             <label>Re-measure Range</label>
-            <select id="remeasure-mode" onchange="updateRemeasurePreview()">
-                <option value="since_calibration">Since Last Calibration</option>
-                <option value="last_n_days">Last N Days</option>
-                <option value="date_range">Custom Date Range</option>
-                <option value="all">All Measurements</option>
-            </select>
+            {{ remeasure_mode_html|safe }}
 
             <div id="remeasure-days-row" style="display: none;">
                 <label>Number of Days</label>
@@ -856,8 +955,26 @@ HTML_TEMPLATE = '''
     </div>
 
     <script>
+        // Frequently used elements, resolved once (the script runs after the markup)
+        const $ = {};
+        ['main-image', 'overlay-layer', 'depth-value', 'timestamp', 'measurement-id', 'outlier-warning', 'sample-rows',
+         'daily-summary', 'mouse-position', 'click-marker', 'cal-property', 'cal-value', 'cal-effective-from',
+         'cal-notes', 'cal-coords', 'cal-hint', 'cal-save-btn', 'calibrate-btn', 'calibration-panel',
+         'cal-section', 'grid-btn', 'cal-status-id', 'cal-status-date', 'cal-set-count', 'cal-total-count',
+         'cal-progress-fill', 'cal-checklist', 'cal-history-container', 'cal-history-body',
+         'cal-data-container', 'cal-data-body',
+         'remeasure-modal', 'remeasure-mode', 'remeasure-days', 'remeasure-days-row', 'remeasure-start',
+         'remeasure-end', 'remeasure-daterange-row', 'remeasure-count', 'remeasure-dates', 'remeasure-progress',
+         'remeasure-progress-fill', 'remeasure-status', 'remeasure-submit'
+        ].forEach(id => $[id] = document.getElementById(id));
+
         let measurements = {{ measurements_json | safe }};
         let currentIndex = {{ current_index }};
+        const timelineItems = document.getElementsByClassName('timeline-item');
+        let lastSelectedIndex = currentIndex;
+        // Overlay images are cache-busted per page load and after calibration
+        // saves only, so revisiting a frame can be served from the browser cache
+        let imageVersion = Date.now();
         let resort = '{{ resort }}';
         let minDepthThreshold = {{ calibration.min_depth_threshold }};
         let showGrid = false;
@@ -870,13 +987,13 @@ HTML_TEMPLATE = '''
 
         function toggleGrid() {
             showGrid = !showGrid;
-            const btn = document.getElementById('grid-btn');
+            const btn = $['grid-btn'];
             if (showGrid) {
                 btn.classList.add('active');
             } else {
                 btn.classList.remove('active');
             }
-            updateDisplay();
+            updateOverlayLayers();
         }
 
         function toggleRegions() {
@@ -887,7 +1004,7 @@ HTML_TEMPLATE = '''
             } else {
                 btn.classList.remove('active');
             }
-            updateDisplay();
+            updateOverlayLayers();
         }
 
         function toggleInches() {
@@ -931,7 +1048,7 @@ HTML_TEMPLATE = '''
             } else {
                 btn.classList.remove('active');
             }
-            updateDisplay();
+            updateOverlayLayers();
         }
 
         function toggleBase() {
@@ -942,125 +1059,265 @@ HTML_TEMPLATE = '''
             } else {
                 btn.classList.remove('active');
             }
-            updateDisplay();
+            updateOverlayLayers();
+        }
+
+        // Navigation only moves currentIndex; the DOM is updated once per
+        // animation frame so held arrow keys don't queue a reflow per repeat
+        let pendingUpdate = false;
+
+        function scheduleUpdate() {
+            if (pendingUpdate) return;
+            pendingUpdate = true;
+            requestAnimationFrame(() => {
+                pendingUpdate = false;
+                updateDisplay();
+            });
         }
 
         function selectMeasurement(idx) {
             if (idx < 0 || idx >= measurements.length) return;
+            // Re-clicking the current item would just reload the same frame
+            if (idx === currentIndex) return;
             currentIndex = idx;
-            updateDisplay();
+            scheduleUpdate();
         }
 
         function prevImage() {
             if (currentIndex > 0) {
                 currentIndex--;
-                updateDisplay();
+                scheduleUpdate();
             }
         }
 
         function nextImage() {
             if (currentIndex < measurements.length - 1) {
                 currentIndex++;
-                updateDisplay();
+                scheduleUpdate();
             }
         }
 
-        function updateDisplay() {
-            const m = measurements[currentIndex];
-            let imgUrl = '/image/' + resort + '/' + m.image + '?t=' + Date.now();
-            if (showGrid) imgUrl += '&grid=true';
-            if (showRegions) imgUrl += '&regions=true';
+        function buildImageUrl(m) {
+            let imgUrl = '/image/' + resort + '/' + m.image + '?v=' + imageVersion;
             if (!showInches) imgUrl += '&inches=false';
             if (!showSamples) imgUrl += '&samples=false';
             if (!showRegion) imgUrl += '&region=false';
-            if (showStake) imgUrl += '&stake=true';
-            if (showBase) imgUrl += '&base=true';
-            document.getElementById('main-image').src = imgUrl;
-            document.getElementById('depth-value').textContent = m.depth;
-            document.getElementById('timestamp').textContent = m.time;
-            document.getElementById('measurement-id').textContent = 'ID: ' + m.id;
+            return imgUrl;
+        }
+
+        // Grid, regions, stake and base don't depend on the frame, so they are
+        // drawn client-side from one SVG and toggled with classes: no new image
+        // request, and the server doesn't have to rasterize them
+        let overlayKey = null;
+
+        function updateOverlayLayers() {
+            const layer = $['overlay-layer'];
+            layer.classList.toggle('show-grid', showGrid);
+            layer.classList.toggle('show-regions', showRegions);
+            layer.classList.toggle('show-stake', showStake);
+            layer.classList.toggle('show-base', showBase);
+            if (showGrid || showRegions || showStake || showBase) loadOverlay();
+        }
+
+        function loadOverlay() {
+            const key = originalImageWidth + 'x' + originalImageHeight;
+            if (key === overlayKey) return;
+            overlayKey = key;
+            fetch('/api/calibration/' + resort + '/overlay.svg?w=' + originalImageWidth + '&h=' + originalImageHeight)
+                .then(response => response.text())
+                .then(svg => { $['overlay-layer'].innerHTML = svg; })
+                .catch(err => {
+                    overlayKey = null;
+                    console.error('Error loading overlay:', err);
+                });
+        }
+
+        // Fetch the overlay again (if shown) after the calibration or image size changes
+        function invalidateOverlay() {
+            overlayKey = null;
+            updateOverlayLayers();
+        }
+
+        // Warm the browser cache with the neighbouring frames while the user
+        // looks at the current one, so the next arrow-key step is instant
+        const scheduleIdle = window.requestIdleCallback
+            ? cb => window.requestIdleCallback(cb)
+            : cb => setTimeout(cb, 200);
+        let preloadImages = [];
+
+        function preloadNeighbours() {
+            const index = currentIndex;
+            scheduleIdle(() => {
+                // Nothing to warm up for a tab nobody is looking at
+                if (index !== currentIndex || document.visibilityState === 'hidden') return;
+                preloadImages = [index + 1, index - 1]
+                    .filter(i => measurements[i])
+                    .map(i => {
+                        const im = new Image();
+                        im.decoding = 'async';
+                        im.src = buildImageUrl(measurements[i]);
+                        return im;
+                    });
+            });
+        }
+
+        // Last state written to the outlier warning; only changed properties
+        // are written, so runs of normal readings leave the element untouched
+        const lastWarning = {
+            text: $['outlier-warning'].textContent,
+            display: $['outlier-warning'].style.display,
+            cls: $['outlier-warning'].className
+        };
+
+        function setWarning(text, display, cls) {
+            const warningEl = $['outlier-warning'];
+            if (text !== lastWarning.text) warningEl.textContent = lastWarning.text = text;
+            if (display !== lastWarning.display) warningEl.style.display = lastWarning.display = display;
+            if (cls !== lastWarning.cls) warningEl.className = lastWarning.cls = cls;
+        }
+
+        function updateDisplay() {
+            const m = measurements[currentIndex];
+            $['main-image'].src = buildImageUrl(m);
+            $['depth-value'].textContent = m.depth;
+            $['timestamp'].textContent = m.time;
+            $['measurement-id'].textContent = 'ID: ' + m.id;
 
             // Handle outlier warning
-            const warningEl = document.getElementById('outlier-warning');
             if (m.is_outlier) {
-                warningEl.textContent = 'Outlier: ' + m.outlier_reason;
-                warningEl.style.display = 'block';
-                warningEl.className = 'outlier-warning';
+                setWarning('Outlier: ' + m.outlier_reason, 'block', 'outlier-warning');
             } else if (m.outlier_reason === 'stake_cleared') {
-                warningEl.textContent = 'Stake cleared/reset';
-                warningEl.style.display = 'block';
-                warningEl.className = 'outlier-warning stake-cleared-warning';
+                setWarning('Stake cleared/reset', 'block', 'outlier-warning stake-cleared-warning');
             } else {
-                warningEl.style.display = 'none';
+                setWarning(lastWarning.text, 'none', lastWarning.cls);
             }
 
-            // Update timeline selection
-            document.querySelectorAll('.timeline-item').forEach((el, idx) => {
-                el.style.border = idx === currentIndex ? '2px solid #fff' : 'none';
-            });
+            // Update timeline selection (only the previous and new items change)
+            if (lastSelectedIndex >= 0 && timelineItems[lastSelectedIndex]) {
+                timelineItems[lastSelectedIndex].classList.remove('active');
+            }
+            if (timelineItems[currentIndex]) {
+                timelineItems[currentIndex].classList.add('active');
+            }
+            lastSelectedIndex = currentIndex;
 
             // Load sample data for this measurement
             loadSampleData(m.id);
+            preloadNeighbours();
+        }
+
+        // Rapid navigation (e.g. holding an arrow key) only fetches samples for
+        // the measurement the user settles on; stale requests are aborted.
+        const SAMPLE_DEBOUNCE_MS = 120;
+        let sampleTimer = null;
+        let sampleController = null;
+
+        // Sample responses keyed by measurement id, oldest first (LRU)
+        const SAMPLE_CACHE_MAX = 200;
+        const sampleCache = new Map();
+
+        function cacheSampleData(measurementId, data) {
+            sampleCache.delete(measurementId);
+            sampleCache.set(measurementId, data);
+            if (sampleCache.size > SAMPLE_CACHE_MAX) {
+                sampleCache.delete(sampleCache.keys().next().value);
+            }
         }
 
         function loadSampleData(measurementId) {
-            fetch('/api/samples/' + measurementId)
+            clearTimeout(sampleTimer);
+            if (sampleCache.has(measurementId)) {
+                if (sampleController) sampleController.abort();
+                const data = sampleCache.get(measurementId);
+                cacheSampleData(measurementId, data);
+                renderSampleRows(data);
+                return;
+            }
+            sampleTimer = setTimeout(() => fetchSampleData(measurementId), SAMPLE_DEBOUNCE_MS);
+        }
+
+        function fetchSampleData(measurementId) {
+            if (sampleController) sampleController.abort();
+            const controller = new AbortController();
+            sampleController = controller;
+            return fetch('/api/samples/' + measurementId, { signal: controller.signal })
                 .then(response => response.json())
                 .then(data => {
-                    const tbody = document.getElementById('sample-rows');
-                    if (!data.samples || data.samples.length === 0) {
-                        tbody.innerHTML = '<tr><td colspan="4" style="color:#888">No sample data</td></tr>';
-                        return;
-                    }
-                    let html = '';
-                    let validCount = 0;
-                    data.samples.forEach((s, i) => {
-                        const num = i + 1;
-                        const depth = s.depth_inches !== null ? s.depth_inches.toFixed(2) + '"' : '-';
-                        const contrast = s.contrast !== null ? s.contrast.toFixed(0) : '-';
-                        const valid = s.valid;
-                        const skip = s.skip_reason || '';
-
-                        if (valid) validCount++;
-
-                        let statusClass = valid ? 'valid' : 'invalid';
-                        let statusText = valid ? '✓' : '✗';
-                        if (skip) {
-                            statusClass = 'skip';
-                            statusText = skip.replace('_', ' ');
-                        }
-
-                        html += '<tr>';
-                        html += '<td>' + num + '</td>';
-                        html += '<td class="depth">' + depth + '</td>';
-                        html += '<td class="contrast">' + contrast + '</td>';
-                        html += '<td class="' + statusClass + '">' + statusText + '</td>';
-                        html += '</tr>';
-                    });
-
-                    // Add summary row with average of valid samples
-                    html += '<tr style="border-top:2px solid #0f3460;background:#1a1a2e">';
-                    html += '<td colspan="2" style="text-align:right;font-weight:bold">Avg (' + validCount + ' valid):</td>';
-                    if (data.depth_avg !== null && data.depth_avg !== undefined) {
-                        // Check if below minimum threshold (per-resort config)
-                        if (data.depth_avg < minDepthThreshold) {
-                            html += '<td style="font-weight:bold;color:#f87171">' + data.depth_avg.toFixed(2) + '"</td>';
-                            html += '<td style="color:#f87171;font-size:10px">below ' + minDepthThreshold + '" threshold</td>';
-                        } else {
-                            html += '<td colspan="2" style="font-weight:bold;color:#4ade80">' + data.depth_avg.toFixed(2) + '"</td>';
-                        }
-                    } else {
-                        html += '<td colspan="2" style="color:#888">-</td>';
-                    }
-                    html += '</tr>';
-
-                    tbody.innerHTML = html;
+                    cacheSampleData(measurementId, data);
+                    renderSampleRows(data);
                 })
                 .catch(err => {
-                    document.getElementById('sample-rows').innerHTML = '<tr><td colspan="4" style="color:#ff6666">Error loading</td></tr>';
+                    if (err.name === 'AbortError') return;
+                    $['sample-rows'].innerHTML = '<tr><td colspan="4" style="color:#ff6666">Error loading</td></tr>';
                 });
         }
 
+        function makeCell(text, className, colSpan) {
+            const td = document.createElement('td');
+            td.textContent = text;
+            if (className) td.className = className;
+            if (colSpan) td.colSpan = colSpan;
+            return td;
+        }
+
+        function renderSampleRows(data) {
+            const tbody = $['sample-rows'];
+            if (!data.samples || data.samples.length === 0) {
+                tbody.innerHTML = '<tr><td colspan="4" style="color:#888">No sample data</td></tr>';
+                return;
+            }
+            // Rows are cloned from a <template> and filled via textContent,
+            // so no HTML is parsed while rendering
+            const rowTpl = document.getElementById('sample-row-tpl').content.firstElementChild;
+            const frag = document.createDocumentFragment();
+            let validCount = 0;
+            const samples = data.samples;
+            for (let i = 0, n = samples.length; i < n; i++) {
+                const s = samples[i];
+                const depth = s.depth_inches !== null ? s.depth_inches.toFixed(2) + '"' : '-';
+                const contrast = s.contrast !== null ? s.contrast.toFixed(0) : '-';
+                const valid = s.valid;
+                const skip = s.skip_reason || '';
+
+                if (valid) validCount++;
+
+                let statusClass = valid ? 'valid' : 'invalid';
+                let statusText = valid ? '✓' : '✗';
+                if (skip) {
+                    statusClass = 'skip';
+                    statusText = skip.replace('_', ' ');
+                }
+
+                const row = rowTpl.cloneNode(true);
+                const cells = row.children;
+                cells[0].textContent = i + 1;
+                cells[1].textContent = depth;
+                cells[2].textContent = contrast;
+                cells[3].className = statusClass;
+                cells[3].textContent = statusText;
+                frag.appendChild(row);
+            }
+
+            // Add summary row with average of valid samples
+            const summary = document.createElement('tr');
+            summary.className = 'sample-summary';
+            summary.appendChild(makeCell('Avg (' + validCount + ' valid):', 'summary-label', 2));
+            if (data.depth_avg !== null && data.depth_avg !== undefined) {
+                // Check if below minimum threshold (per-resort config)
+                if (data.depth_avg < minDepthThreshold) {
+                    summary.appendChild(makeCell(data.depth_avg.toFixed(2) + '"', 'summary-avg-low'));
+                    summary.appendChild(makeCell('below ' + minDepthThreshold + '" threshold', 'summary-threshold'));
+                } else {
+                    summary.appendChild(makeCell(data.depth_avg.toFixed(2) + '"', 'summary-avg', 2));
+                }
+            } else {
+                summary.appendChild(makeCell('-', 'summary-empty', 2));
+            }
+            frag.appendChild(summary);
+
+            tbody.replaceChildren(frag);
+        }
+
         function loadData() {
             const resort = document.getElementById('resort').value;
             const date = document.getElementById('date').value;
@@ -1107,98 +1364,134 @@ HTML_TEMPLATE = '''
                 });
         }
 
+        // Rendered daily summaries keyed by resort|date. Kept in sessionStorage
+        // because changing the date reloads the page; a cached summary is shown
+        // immediately and then revalidated in the background.
+        const summaryCache = new Map();
+
+        function getCachedSummary(key) {
+            if (summaryCache.has(key)) return summaryCache.get(key);
+            try {
+                return sessionStorage.getItem('summary|' + key);
+            } catch (e) {
+                return null;
+            }
+        }
+
+        function setCachedSummary(key, html) {
+            summaryCache.set(key, html);
+            try {
+                sessionStorage.setItem('summary|' + key, html);
+            } catch (e) {
+                // Storage full or unavailable; the in-memory copy still works
+            }
+        }
+
         function loadDailySummary() {
             const date = document.getElementById('date').value;
-            fetch('/api/daily_summary/' + resort + '/' + date)
+            const cacheKey = resort + '|' + date;
+            const container = $['daily-summary'];
+            const cached = getCachedSummary(cacheKey);
+            if (cached !== null) container.innerHTML = cached;
+
+            return fetch('/api/daily_summary/' + resort + '/' + date)
                 .then(response => response.json())
                 .then(data => {
-                    const container = document.getElementById('daily-summary');
                     if (data.error) {
                         container.innerHTML = '<div class="stat-row"><span style="color:#888">' + data.error + '</span></div>';
                         return;
                     }
+                    const html = renderDailySummary(data);
+                    if (html !== cached) container.innerHTML = html;
+                    setCachedSummary(cacheKey, html);
+                })
+                .catch(err => {
+                    if (cached !== null) return;
+                    $['daily-summary'].innerHTML = '<div class="stat-row"><span style="color:#ff6666">Error loading summary</span></div>';
+                });
+        }
 
-                    let html = '';
+        function renderDailySummary(data) {
+            const parts = [];
 
-                    // Accumulation (sum of positive deltas) - most important stat
-                    if (data.accumulation_inches !== undefined) {
-                        html += '<div class="stat-row" style="background:#1a3a1a;border-radius:5px;padding:5px">';
-                        html += '<span style="font-weight:bold">Day Accumulation</span>';
-                        html += '<span class="stat-value" style="color:#4ade80;font-size:1.2em">+' + data.accumulation_inches + '"</span>';
-                        html += '</div>';
-                    }
+            // Accumulation (sum of positive deltas) - most important stat
+            if (data.accumulation_inches !== undefined) {
+                parts.push('<div class="stat-row accumulation">');
+                parts.push('<span class="stat-label">Day Accumulation</span>');
+                parts.push('<span class="stat-value">+' + data.accumulation_inches + '"</span>');
+                parts.push('</div>');
+            }
 
-                    // Day max with time
-                    if (data.day_max) {
-                        html += '<div class="stat-row">';
-                        html += '<span>Day Max</span>';
-                        html += '<span class="stat-value">' + data.day_max.depth_inches + '" @ ' + data.day_max.latest_time + '</span>';
-                        html += '</div>';
-                    }
+            // Day max with time
+            if (data.day_max) {
+                parts.push('<div class="stat-row">');
+                parts.push('<span>Day Max</span>');
+                parts.push('<span class="stat-value">' + data.day_max.depth_inches + '" @ ' + data.day_max.latest_time + '</span>');
+                parts.push('</div>');
+            }
 
-                    // Day min with time
-                    if (data.day_min) {
-                        html += '<div class="stat-row">';
-                        html += '<span>Day Min</span>';
-                        html += '<span class="stat-value">' + data.day_min.depth_inches + '" @ ' + data.day_min.latest_time + '</span>';
-                        html += '</div>';
-                    }
+            // Day min with time
+            if (data.day_min) {
+                parts.push('<div class="stat-row">');
+                parts.push('<span>Day Min</span>');
+                parts.push('<span class="stat-value">' + data.day_min.depth_inches + '" @ ' + data.day_min.latest_time + '</span>');
+                parts.push('</div>');
+            }
 
-                    // Hours with data
-                    html += '<div class="stat-row">';
-                    html += '<span>Hours with data</span>';
-                    html += '<span class="stat-value">' + data.hours_with_data + '</span>';
-                    html += '</div>';
-
-                    // Hourly breakdown (collapsed by default) with deltas
-                    if (data.hourly_readings && data.hourly_readings.length > 0) {
-                        html += '<details style="margin-top:10px">';
-                        html += '<summary style="cursor:pointer;color:#e94560">Hourly Breakdown</summary>';
-                        html += '<table class="sample-table" style="margin-top:5px;font-size:12px">';
-                        html += '<thead><tr><th>Hour</th><th>Depth</th><th>Change</th></tr></thead>';
-                        html += '<tbody>';
-                        data.hourly_readings.forEach(h => {
-                            let deltaStr = '-';
-                            let deltaStyle = '';
-                            if (h.delta_inches !== null) {
-                                if (h.delta_inches > 0) {
-                                    deltaStr = '+' + h.delta_inches + '"';
-                                    deltaStyle = 'color:#4ade80';  // green for positive
-                                } else if (h.delta_inches < 0) {
-                                    deltaStr = h.delta_inches + '"';
-                                    deltaStyle = 'color:#f87171';  // red for negative
-                                } else {
-                                    deltaStr = '0"';
-                                }
-                            }
-                            html += '<tr>';
-                            html += '<td>' + h.hour + '</td>';
-                            html += '<td>' + h.avg_depth_inches + '"</td>';
-                            html += '<td style="' + deltaStyle + '">' + deltaStr + '</td>';
-                            html += '</tr>';
-                        });
-                        html += '</tbody></table>';
-                        html += '</details>';
+            // Hours with data
+            parts.push('<div class="stat-row">');
+            parts.push('<span>Hours with data</span>');
+            parts.push('<span class="stat-value">' + data.hours_with_data + '</span>');
+            parts.push('</div>');
+
+            // Hourly breakdown (collapsed by default) with deltas
+            if (data.hourly_readings && data.hourly_readings.length > 0) {
+                parts.push('<details class="hourly-breakdown">');
+                parts.push('<summary>Hourly Breakdown</summary>');
+                parts.push('<table class="sample-table">');
+                parts.push('<thead><tr><th>Hour</th><th>Depth</th><th>Change</th></tr></thead>');
+                parts.push('<tbody>');
+                data.hourly_readings.forEach(h => {
+                    let deltaStr = '-';
+                    let deltaClass = '';
+                    if (h.delta_inches !== null) {
+                        if (h.delta_inches > 0) {
+                            deltaStr = `+${h.delta_inches}"`;
+                            deltaClass = 'delta-pos';  // green for positive
+                        } else if (h.delta_inches < 0) {
+                            deltaStr = `${h.delta_inches}"`;
+                            deltaClass = 'delta-neg';  // red for negative
+                        } else {
+                            deltaStr = '0"';
+                        }
                     }
-
-                    container.innerHTML = html;
-                })
-                .catch(err => {
-                    document.getElementById('daily-summary').innerHTML = '<div class="stat-row"><span style="color:#ff6666">Error loading summary</span></div>';
+                    parts.push(`<tr><td>${h.hour}</td><td>${h.avg_depth_inches}"</td><td class="${deltaClass}">${deltaStr}</td></tr>`);
                 });
+                parts.push('</tbody></table>');
+                parts.push('</details>');
+            }
+
+            return parts.join('');
         }
 
         // Keyboard navigation
         document.addEventListener('keydown', function(e) {
-            if (e.key === 'ArrowLeft') prevImage();
-            if (e.key === 'ArrowRight') nextImage();
-        });
+            // Arrow keys inside form fields move the caret, not the timeline
+            if (e.target.matches && e.target.matches('input, textarea, select')) return;
+            switch (e.key) {
+                case 'ArrowLeft': prevImage(); break;
+                case 'ArrowRight': nextImage(); break;
+                default: return;
+            }
+        }, { passive: true });
 
-        // Load data on page load
-        if (measurements.length > 0 && measurements[currentIndex]) {
-            loadSampleData(measurements[currentIndex].id);
-        }
-        loadDailySummary();
+        // Load data on page load (independent requests, issued together)
+        Promise.all([
+            measurements.length > 0 && measurements[currentIndex]
+                ? fetchSampleData(measurements[currentIndex].id)
+                : null,
+            loadDailySummary()
+        ]);
 
         // ============ Calibration Mode ============
         let calibrationMode = false;
@@ -1210,10 +1503,10 @@ HTML_TEMPLATE = '''
 
         function toggleCalibrationMode() {
             calibrationMode = !calibrationMode;
-            const btn = document.getElementById('calibrate-btn');
-            const panel = document.getElementById('calibration-panel');
+            const btn = $['calibrate-btn'];
+            const panel = $['calibration-panel'];
             const container = document.querySelector('.image-container');
-            const calSection = document.getElementById('cal-section');
+            const calSection = $['cal-section'];
 
             if (calibrationMode) {
                 btn.classList.add('active');
@@ -1235,24 +1528,39 @@ HTML_TEMPLATE = '''
             }
         }
 
+        // The sv-SE locale formats local time as 'YYYY-MM-DD HH:MM'
+        const LOCAL_DATETIME_FMT = new Intl.DateTimeFormat('sv-SE', {
+            year: 'numeric', month: '2-digit', day: '2-digit',
+            hour: '2-digit', minute: '2-digit', hourCycle: 'h23'
+        });
+
         function setDefaultEffectiveDate() {
             // Always default to NOW so new calibrations become immediately effective
             // Format as local time for datetime-local input (YYYY-MM-DDTHH:MM)
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const hours = String(now.getHours()).padStart(2, '0');
-            const minutes = String(now.getMinutes()).padStart(2, '0');
-            document.getElementById('cal-effective-from').value = `${year}-${month}-${day}T${hours}:${minutes}`;
+            $['cal-effective-from'].value = LOCAL_DATETIME_FMT.format(new Date()).replace(' ', 'T');
         }
 
+        // Static calibration lookups, built once rather than on every call
+        const CORNER_KEYS = Object.freeze(['top_left', 'top_right', 'bottom_left', 'bottom_right']);
+        const AXIS_KEYS = Object.freeze(['top', 'bottom']);
+        const MARKER_INCHES = Object.freeze([0, 2, 4, 6, 8, 10, 12, 14, 16, 18]);
+        const POINT_GROUPS = new Set(['stake_corners', 'stake_axis', 'sample_bounds']);
+        // Property key -> { group, field, isPoint } for every option in the property select
+        const CAL_INDEX = new Map(
+            Array.from($['cal-property'].options, o => o.value).filter(Boolean).map(key => {
+                const [group, field] = key.split('.');
+                return [key, { group, field, isPoint: POINT_GROUPS.has(group) }];
+            })
+        );
+
         // Handle clicks on the image container
         document.querySelector('.image-container').addEventListener('click', function(e) {
             if (!calibrationMode) return;
 
-            const img = document.getElementById('main-image');
+            // Read both rects together so layout is flushed at most once per click
+            const img = $['main-image'];
             const rect = img.getBoundingClientRect();
+            const containerRect = this.getBoundingClientRect();
 
             // Calculate click position relative to image
             const relX = e.clientX - rect.left;
@@ -1266,41 +1574,38 @@ HTML_TEMPLATE = '''
             clickedY = Math.round(relY * scaleY);
 
             // Update display
-            document.getElementById('cal-coords').textContent = `X: ${clickedX}, Y: ${clickedY}`;
+            $['cal-coords'].textContent = `X: ${clickedX}, Y: ${clickedY}`;
 
             // Show click marker at the clicked position (in display coordinates)
-            showClickMarker(relX, relY, rect);
+            showClickMarker(relX, relY, rect, containerRect);
 
             // Auto-fill value based on selected property type
-            const prop = document.getElementById('cal-property').value;
+            const prop = $['cal-property'].value;
             if (prop) {
-                if (prop.startsWith('stake_corners.') || prop.startsWith('stake_axis.') || prop.startsWith('sample_bounds.')) {
+                const info = CAL_INDEX.get(prop) || {};
+                if (info.isPoint) {
                     // Point properties: set [X, Y]
-                    document.getElementById('cal-value').value = `${clickedX}, ${clickedY}`;
-                } else if (prop.startsWith('marker_positions')) {
+                    $['cal-value'].value = `${clickedX}, ${clickedY}`;
+                } else if (info.group === 'marker_positions') {
                     // Marker positions: Y only
-                    document.getElementById('cal-value').value = clickedY;
+                    $['cal-value'].value = clickedY;
                 } else if (prop.includes('_x')) {
-                    document.getElementById('cal-value').value = clickedX;
+                    $['cal-value'].value = clickedX;
                 } else if (prop.includes('_y')) {
-                    document.getElementById('cal-value').value = clickedY;
+                    $['cal-value'].value = clickedY;
                 }
             }
 
             updateSaveButtonState();
         });
 
-        function showClickMarker(displayX, displayY, imgRect) {
-            const marker = document.getElementById('click-marker');
-            const container = document.querySelector('.image-container');
-            const containerRect = container.getBoundingClientRect();
-            const imgElement = document.getElementById('main-image');
-            const imgDisplayRect = imgElement.getBoundingClientRect();
+        function showClickMarker(displayX, displayY, imgRect, containerRect) {
+            const marker = $['click-marker'];
 
             // Position marker relative to container, accounting for image position within container
             // CSS transform: translate(-50%, -50%) already centers the marker
-            const offsetX = imgDisplayRect.left - containerRect.left;
-            const offsetY = imgDisplayRect.top - containerRect.top;
+            const offsetX = imgRect.left - containerRect.left;
+            const offsetY = imgRect.top - containerRect.top;
 
             marker.style.left = (offsetX + displayX) + 'px';
             marker.style.top = (offsetY + displayY) + 'px';
@@ -1308,23 +1613,23 @@ HTML_TEMPLATE = '''
         }
 
         function hideClickMarker() {
-            document.getElementById('click-marker').style.display = 'none';
+            $['click-marker'].style.display = 'none';
         }
 
         function updateSaveButtonState() {
-            const prop = document.getElementById('cal-property').value;
-            const value = document.getElementById('cal-value').value;
-            const effectiveFrom = document.getElementById('cal-effective-from').value;
+            const prop = $['cal-property'].value;
+            const value = $['cal-value'].value;
+            const effectiveFrom = $['cal-effective-from'].value;
 
             const canSave = prop && value && effectiveFrom;
-            document.getElementById('cal-save-btn').disabled = !canSave;
+            $['cal-save-btn'].disabled = !canSave;
         }
 
         // ============ Calibration Data Table ============
         let currentCalibrationData = null;
 
         function toggleCalDataTable() {
-            const container = document.getElementById('cal-data-container');
+            const container = $['cal-data-container'];
             if (container.style.display === 'none') {
                 container.style.display = 'block';
                 loadCalibrationData();
@@ -1342,12 +1647,12 @@ HTML_TEMPLATE = '''
                         renderCalibrationTable(data.calibration, data.id, data.effective_from);
                         validateCalibration(data.calibration);
                     } else {
-                        document.getElementById('cal-data-body').innerHTML =
+                        $['cal-data-body'].innerHTML =
                             '<tr><td colspan="2" class="missing">No calibration found</td></tr>';
                     }
                 })
                 .catch(err => {
-                    document.getElementById('cal-data-body').innerHTML =
+                    $['cal-data-body'].innerHTML =
                         '<tr><td colspan="2" class="missing">Error loading calibration</td></tr>';
                 });
         }
@@ -1356,54 +1661,62 @@ HTML_TEMPLATE = '''
             document.getElementById('cal-current-id').textContent = id || '-';
             document.getElementById('cal-current-date').textContent = effectiveFrom || '-';
 
-            let html = '';
+            const parts = [];
 
             // Stake Corners
-            html += '<tr class="section-header"><td colspan="2">Stake Corners</td></tr>';
+            parts.push('<tr class="section-header"><td colspan="2">Stake Corners</td></tr>');
             const corners = cal.stake_corners || {};
-            ['top_left', 'top_right', 'bottom_left', 'bottom_right'].forEach(k => {
+            for (const k of CORNER_KEYS) {
                 const val = corners[k];
                 const cls = val ? '' : 'missing';
-                html += '<tr><td>' + k.replace('_', ' ') + '</td><td class="' + cls + '">' +
-                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>';
-            });
+                parts.push('<tr><td>' + k.replace('_', ' ') + '</td><td class="' + cls + '">' +
+                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>');
+            }
 
             // Stake Axis
-            html += '<tr class="section-header"><td colspan="2">Stake Axis</td></tr>';
+            parts.push('<tr class="section-header"><td colspan="2">Stake Axis</td></tr>');
             const axis = cal.stake_axis || {};
-            ['top', 'bottom'].forEach(k => {
+            for (const k of AXIS_KEYS) {
                 const val = axis[k];
                 const cls = val ? '' : 'missing';
-                html += '<tr><td>' + k + '</td><td class="' + cls + '">' +
-                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>';
-            });
+                parts.push('<tr><td>' + k + '</td><td class="' + cls + '">' +
+                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>');
+            }
 
             // Sample Bounds (Base)
-            html += '<tr class="section-header"><td colspan="2">Snow Stake Base</td></tr>';
+            parts.push('<tr class="section-header"><td colspan="2">Snow Stake Base</td></tr>');
             const bounds = cal.sample_bounds || {};
-            ['top_left', 'top_right', 'bottom_left', 'bottom_right'].forEach(k => {
+            for (const k of CORNER_KEYS) {
                 const val = bounds[k];
                 const cls = val ? '' : 'missing';
-                html += '<tr><td>' + k.replace('_', ' ') + '</td><td class="' + cls + '">' +
-                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>';
-            });
+                parts.push('<tr><td>' + k.replace('_', ' ') + '</td><td class="' + cls + '">' +
+                    (val ? '[' + val.join(', ') + ']' : 'NOT SET') + '</td></tr>');
+            }
 
             // Marker Positions
-            html += '<tr class="section-header"><td colspan="2">Marker Positions (Y)</td></tr>';
+            parts.push('<tr class="section-header"><td colspan="2">Marker Positions (Y)</td></tr>');
             const markers = cal.marker_positions || {};
-            [0, 2, 4, 6, 8, 10, 12, 14, 16, 18].forEach(inch => {
+            for (const inch of MARKER_INCHES) {
                 const val = markers[inch] || markers[String(inch)];
                 const cls = val !== undefined ? '' : 'missing';
-                html += '<tr><td>' + inch + '"</td><td class="' + cls + '">' +
-                    (val !== undefined ? val : 'NOT SET') + '</td></tr>';
-            });
+                parts.push('<tr><td>' + inch + '"</td><td class="' + cls + '">' +
+                    (val !== undefined ? val : 'NOT SET') + '</td></tr>');
+            }
 
             // Other
-            html += '<tr class="section-header"><td colspan="2">Other</td></tr>';
-            html += '<tr><td>camera_tilt</td><td>' + (cal.camera_tilt || 0) + '°</td></tr>';
-            html += '<tr><td>min_depth_threshold</td><td>' + (cal.min_depth_threshold || 1.0) + '"</td></tr>';
+            parts.push('<tr class="section-header"><td colspan="2">Other</td></tr>');
+            parts.push('<tr><td>camera_tilt</td><td>' + (cal.camera_tilt || 0) + '°</td></tr>');
+            parts.push('<tr><td>min_depth_threshold</td><td>' + (cal.min_depth_threshold || 1.0) + '"</td></tr>');
+
+            $['cal-data-body'].innerHTML = parts.join('');
+        }
 
-            document.getElementById('cal-data-body').innerHTML = html;
+        function missingKeys(obj, keys) {
+            const missing = [];
+            for (let i = 0; i < keys.length; i++) {
+                if (!obj[keys[i]]) missing.push(keys[i]);
+            }
+            return missing;
         }
 
         function validateCalibration(cal) {
@@ -1411,16 +1724,14 @@ HTML_TEMPLATE = '''
 
             // Check stake_corners
             const corners = cal.stake_corners || {};
-            const missingCorners = ['top_left', 'top_right', 'bottom_left', 'bottom_right']
-                .filter(k => !corners[k]);
+            const missingCorners = missingKeys(corners, CORNER_KEYS);
             if (missingCorners.length > 0 && missingCorners.length < 4) {
                 warnings.push('Stake corners incomplete: missing ' + missingCorners.join(', '));
             }
 
             // Check sample_bounds
             const bounds = cal.sample_bounds || {};
-            const missingBounds = ['top_left', 'top_right', 'bottom_left', 'bottom_right']
-                .filter(k => !bounds[k]);
+            const missingBounds = missingKeys(bounds, CORNER_KEYS);
             if (missingBounds.length > 0 && missingBounds.length < 4) {
                 warnings.push('Base corners incomplete: missing ' + missingBounds.join(', '));
             }
@@ -1441,16 +1752,17 @@ HTML_TEMPLATE = '''
         }
 
         // Update save button state when inputs change
-        document.getElementById('cal-property').addEventListener('change', function() {
+        $['cal-property'].addEventListener('change', function() {
             // Update hint based on property type
             const prop = this.value;
-            const hint = document.getElementById('cal-hint');
-            const valueInput = document.getElementById('cal-value');
-            if (prop.startsWith('stake_corners.') || prop.startsWith('stake_axis.') || prop.startsWith('sample_bounds.')) {
+            const hint = $['cal-hint'];
+            const valueInput = $['cal-value'];
+            const info = CAL_INDEX.get(prop) || {};
+            if (info.isPoint) {
                 hint.textContent = 'Click to set X, Y point';
                 valueInput.placeholder = 'X, Y (e.g., 815, 300)';
                 valueInput.type = 'text';
-            } else if (prop.startsWith('marker_positions')) {
+            } else if (info.group === 'marker_positions') {
                 hint.textContent = 'Click to set Y coordinate';
                 valueInput.placeholder = 'Y coordinate';
                 valueInput.type = 'number';
@@ -1465,16 +1777,16 @@ HTML_TEMPLATE = '''
             }
             updateSaveButtonState();
         });
-        document.getElementById('cal-value').addEventListener('input', updateSaveButtonState);
-        document.getElementById('cal-effective-from').addEventListener('input', updateSaveButtonState);
+        $['cal-value'].addEventListener('input', updateSaveButtonState);
+        $['cal-effective-from'].addEventListener('input', updateSaveButtonState);
 
         function cancelCalibration() {
             // Reset form
-            document.getElementById('cal-property').value = '';
-            document.getElementById('cal-value').value = '';
-            document.getElementById('cal-notes').value = '';
-            document.getElementById('cal-coords').textContent = 'Click image';
-            document.getElementById('cal-hint').textContent = 'Select a property, then click on the image';
+            $['cal-property'].value = '';
+            $['cal-value'].value = '';
+            $['cal-notes'].value = '';
+            $['cal-coords'].textContent = 'Click image';
+            $['cal-hint'].textContent = 'Select a property, then click on the image';
             hideClickMarker();
             clickedX = null;
             clickedY = null;
@@ -1485,10 +1797,10 @@ HTML_TEMPLATE = '''
         }
 
         function saveCalibration() {
-            const prop = document.getElementById('cal-property').value;
-            const rawValue = document.getElementById('cal-value').value;
-            const effectiveFrom = document.getElementById('cal-effective-from').value;
-            const notes = document.getElementById('cal-notes').value;
+            const prop = $['cal-property'].value;
+            const rawValue = $['cal-value'].value;
+            const effectiveFrom = $['cal-effective-from'].value;
+            const notes = $['cal-notes'].value;
 
             if (!prop || !rawValue || !effectiveFrom) {
                 alert('Please fill in all required fields');
@@ -1496,8 +1808,9 @@ HTML_TEMPLATE = '''
             }
 
             // Parse value based on property type
+            const info = CAL_INDEX.get(prop) || {};
             let value;
-            if (prop.startsWith('stake_corners.') || prop.startsWith('stake_axis.') || prop.startsWith('sample_bounds.')) {
+            if (info.isPoint) {
                 // Parse "X, Y" format into [X, Y] array
                 const parts = rawValue.split(',').map(s => parseInt(s.trim()));
                 if (parts.length !== 2 || parts.some(isNaN)) {
@@ -1515,22 +1828,9 @@ HTML_TEMPLATE = '''
 
             // Build the config object
             let config = {};
-            if (prop.startsWith('marker_positions.')) {
-                const inch = prop.split('.')[1];
-                config.marker_positions = {};
-                config.marker_positions[inch] = value;
-            } else if (prop.startsWith('stake_corners.')) {
-                const corner = prop.split('.')[1];
-                config.stake_corners = {};
-                config.stake_corners[corner] = value;
-            } else if (prop.startsWith('stake_axis.')) {
-                const point = prop.split('.')[1];
-                config.stake_axis = {};
-                config.stake_axis[point] = value;
-            } else if (prop.startsWith('sample_bounds.')) {
-                const point = prop.split('.')[1];
-                config.sample_bounds = {};
-                config.sample_bounds[point] = value;
+            if (info.field !== undefined) {
+                config[info.group] = {};
+                config[info.group][info.field] = value;
             } else {
                 config[prop] = value;
             }
@@ -1551,19 +1851,16 @@ HTML_TEMPLATE = '''
                 if (data.success) {
                     alert('Calibration saved successfully!');
                     // Reset form but keep panel open
-                    document.getElementById('cal-property').value = '';
-                    document.getElementById('cal-value').value = '';
-                    document.getElementById('cal-notes').value = '';
-                    document.getElementById('cal-coords').textContent = 'Click image';
+                    $['cal-property'].value = '';
+                    $['cal-value'].value = '';
+                    $['cal-notes'].value = '';
+                    $['cal-coords'].textContent = 'Click image';
                     hideClickMarker();
                     updateSaveButtonState();
-                    // Reload calibration data table if visible
-                    if (document.getElementById('cal-data-container').style.display !== 'none') {
-                        loadCalibrationData();
-                    }
-                    // Refresh calibration status (progress indicator + history table)
-                    updateCalibrationStatus();
+                    // Refresh calibration status, history and data table
+                    refreshAfterCalibrationSave();
                     // Refresh image to show new calibration
+                    imageVersion++;
                     updateDisplay();
                 } else {
                     alert('Error saving calibration: ' + data.error);
@@ -1575,157 +1872,172 @@ HTML_TEMPLATE = '''
         }
 
         // ============ Calibration Status Section ============
-        const CALIBRATION_POINTS = [
-            // Stake corners (4 points)
-            { key: 'stake_corners.top_left', label: 'Stake TL', category: 'stake' },
-            { key: 'stake_corners.top_right', label: 'Stake TR', category: 'stake' },
-            { key: 'stake_corners.bottom_left', label: 'Stake BL', category: 'stake' },
-            { key: 'stake_corners.bottom_right', label: 'Stake BR', category: 'stake' },
-            // Sample bounds (4 points)
-            { key: 'sample_bounds.top_left', label: 'Sample TL', category: 'sample' },
-            { key: 'sample_bounds.top_right', label: 'Sample TR', category: 'sample' },
-            { key: 'sample_bounds.bottom_left', label: 'Sample BL', category: 'sample' },
-            { key: 'sample_bounds.bottom_right', label: 'Sample BR', category: 'sample' },
-            // Stake axis (2 points)
-            { key: 'stake_axis.top', label: 'Axis Top', category: 'axis' },
-            { key: 'stake_axis.bottom', label: 'Axis Bot', category: 'axis' },
-            // Marker positions (10 markers)
-            { key: 'marker_positions.0', label: '0"', category: 'marker' },
-            { key: 'marker_positions.2', label: '2"', category: 'marker' },
-            { key: 'marker_positions.4', label: '4"', category: 'marker' },
-            { key: 'marker_positions.6', label: '6"', category: 'marker' },
-            { key: 'marker_positions.8', label: '8"', category: 'marker' },
-            { key: 'marker_positions.10', label: '10"', category: 'marker' },
-            { key: 'marker_positions.12', label: '12"', category: 'marker' },
-            { key: 'marker_positions.14', label: '14"', category: 'marker' },
-            { key: 'marker_positions.16', label: '16"', category: 'marker' },
-            { key: 'marker_positions.18', label: '18"', category: 'marker' }
-        ];
-
-        function getNestedValue(obj, path) {
-            const parts = path.split('.');
-            let val = obj;
-            for (const p of parts) {
-                if (val === undefined || val === null) return undefined;
-                val = val[p];
+        function updateCalibrationStatus() {
+            // Status and history are independent, so fetch them side by side.
+            // The history table is collapsed by default; while it is hidden
+            // it is only marked stale and loaded when next opened.
+            const historyVisible = $['cal-history-container'].style.display !== 'none';
+            if (!historyVisible) calHistoryStale = true;
+            return Promise.all([
+                fetch('/api/calibration/' + resort + '/current')
+                    .then(response => response.json())
+                    .then(renderCalibrationStatus)
+                    .catch(err => {
+                        console.error('Error loading calibration status:', err);
+                    }),
+                historyVisible ? loadCalHistoryTable() : null
+            ]);
+        }
+
+        // The panel is only fetched when calibration mode opens, so catch up
+        // when the tab comes back into view (it may have been edited elsewhere)
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'visible') {
+                if (calibrationMode) updateCalibrationStatus();
+                preloadNeighbours();
+            }
+        });
+
+        // The calibration panel renderers build everything off-document first
+        // and then apply all their writes together in the next animation frame
+        function renderCalibrationStatus(data) {
+            if (!data.success) {
+                requestAnimationFrame(() => {
+                    $['cal-status-id'].textContent = '-';
+                    $['cal-status-date'].textContent = '-';
+                    $['cal-set-count'].textContent = '0';
+                    $['cal-progress-fill'].style.width = '0%';
+                });
+                return;
             }
-            return val;
+
+            // Checklist rows arrive precomputed as [key, label, isSet, valStr]
+            const checklist = data.checklist || [];
+            let setCount = 0;
+            for (let i = 0; i < checklist.length; i++) {
+                if (checklist[i][2]) setCount++;
+            }
+            const total = checklist.length;
+            const progressWidth = (total ? setCount / total * 100 : 0) + '%';
+            const frag = document.createDocumentFragment();
+            for (let i = 0; i < checklist.length; i++) {
+                const [key, label, isSet, valStr] = checklist[i];
+                const item = document.createElement('div');
+                item.className = 'cal-check-item ' + (isSet ? 'set' : 'unset');
+                item.title = key;
+                item.appendChild(makeSpan('cal-check-icon', isSet ? '✓' : '○'));
+                item.appendChild(makeSpan('cal-check-label', label));
+                item.appendChild(makeSpan('cal-check-val', valStr));
+                frag.appendChild(item);
+            }
+
+            requestAnimationFrame(() => {
+                $['cal-status-id'].textContent = data.id || '-';
+                $['cal-status-date'].textContent = data.effective_from || '-';
+                $['cal-set-count'].textContent = setCount;
+                $['cal-total-count'].textContent = total;
+                $['cal-progress-fill'].style.width = progressWidth;
+                $['cal-checklist'].replaceChildren(frag);
+            });
         }
 
-        function updateCalibrationStatus() {
-            fetch('/api/calibration/' + resort + '/current')
+        function makeSpan(className, text) {
+            const span = document.createElement('span');
+            span.className = className;
+            span.textContent = text;
+            return span;
+        }
+
+        // Refresh everything the panel shows after a save with one request
+        function refreshAfterCalibrationSave() {
+            fetch('/api/calibration/' + resort + '/post_save_bundle?limit=10')
                 .then(response => response.json())
                 .then(data => {
-                    if (!data.success) {
-                        document.getElementById('cal-status-id').textContent = '-';
-                        document.getElementById('cal-status-date').textContent = '-';
-                        document.getElementById('cal-set-count').textContent = '0';
-                        document.getElementById('cal-progress-fill').style.width = '0%';
-                        return;
+                    renderCalibrationStatus(data);
+                    if (!data.success) return;
+                    invalidateOverlay();
+                    calHistoryStale = false;
+                    renderCalHistory(data.history);
+                    // Reload calibration data table if visible
+                    if ($['cal-data-container'].style.display !== 'none') {
+                        currentCalibrationData = data.calibration;
+                        renderCalibrationTable(data.calibration, data.id, data.effective_from);
+                        validateCalibration(data.calibration);
                     }
-
-                    const cal = data.calibration || {};
-                    document.getElementById('cal-status-id').textContent = data.id || '-';
-                    document.getElementById('cal-status-date').textContent = data.effective_from || '-';
-
-                    // Count set points
-                    let setCount = 0;
-                    let checklistHtml = '';
-
-                    CALIBRATION_POINTS.forEach(pt => {
-                        const val = getNestedValue(cal, pt.key);
-                        const isSet = val !== undefined && val !== null;
-                        if (isSet) setCount++;
-
-                        const statusClass = isSet ? 'set' : 'unset';
-                        const statusIcon = isSet ? '✓' : '○';
-                        // Format value for display
-                        let valStr = '';
-                        if (isSet) {
-                            if (Array.isArray(val)) {
-                                valStr = `[${val.join(', ')}]`;
-                            } else {
-                                valStr = String(val);
-                            }
-                        }
-                        checklistHtml += `<div class="cal-check-item ${statusClass}" title="${pt.key}">
-                            <span class="cal-check-icon">${statusIcon}</span>
-                            <span class="cal-check-label">${pt.label}</span>
-                            <span class="cal-check-val">${valStr}</span>
-                        </div>`;
-                    });
-
-                    const total = CALIBRATION_POINTS.length;
-                    document.getElementById('cal-set-count').textContent = setCount;
-                    document.getElementById('cal-total-count').textContent = total;
-                    document.getElementById('cal-progress-fill').style.width = (setCount / total * 100) + '%';
-                    document.getElementById('cal-checklist').innerHTML = checklistHtml;
-
-                    // Also load history table
-                    loadCalHistoryTable();
                 })
                 .catch(err => {
-                    console.error('Error loading calibration status:', err);
+                    console.error('Error refreshing calibration:', err);
                 });
         }
 
+        // Whether the history table needs a fetch before it is next shown
+        let calHistoryStale = true;
+
         function toggleCalHistory() {
-            const container = document.getElementById('cal-history-container');
+            const container = $['cal-history-container'];
             if (container.style.display === 'none') {
                 container.style.display = 'block';
+                if (calHistoryStale) loadCalHistoryTable();
             } else {
                 container.style.display = 'none';
             }
         }
 
         function loadCalHistoryTable() {
-            fetch('/api/calibration/' + resort + '/history?limit=10')
+            return fetch('/api/calibration/' + resort + '/history?limit=10')
                 .then(response => response.json())
                 .then(data => {
-                    const tbody = document.getElementById('cal-history-body');
-                    if (!data.success || !data.versions || data.versions.length === 0) {
-                        tbody.innerHTML = '<tr><td colspan="4" style="color:#888">No history</td></tr>';
-                        return;
-                    }
-
-                    let html = '';
-                    data.versions.forEach(v => {
-                        const effDate = new Date(v.effective_from).toLocaleString();
-                        const created = v.created_at ? new Date(v.created_at).toLocaleString() : '-';
-                        const notes = v.notes || '-';
-                        html += `<tr>
-                            <td>${v.id}</td>
-                            <td>${effDate}</td>
-                            <td>${created}</td>
-                            <td>${notes}</td>
-                        </tr>`;
-                    });
-                    tbody.innerHTML = html;
+                    calHistoryStale = false;
+                    renderCalHistory(data.success ? data.versions : null);
                 })
                 .catch(err => {
-                    document.getElementById('cal-history-body').innerHTML =
+                    $['cal-history-body'].innerHTML =
                         '<tr><td colspan="4" style="color:#f66">Error loading history</td></tr>';
                 });
         }
 
+        function renderCalHistory(versions) {
+            const tbody = $['cal-history-body'];
+            if (!versions || versions.length === 0) {
+                requestAnimationFrame(() => {
+                    tbody.innerHTML = '<tr><td colspan="4" style="color:#888">No history</td></tr>';
+                });
+                return;
+            }
+
+            const frag = document.createDocumentFragment();
+            for (let i = 0; i < versions.length; i++) {
+                const v = versions[i];
+                const row = document.createElement('tr');
+                row.appendChild(makeCell(v.id));
+                row.appendChild(makeCell(new Date(v.effective_from).toLocaleString()));
+                row.appendChild(makeCell(v.created_at ? new Date(v.created_at).toLocaleString() : '-'));
+                row.appendChild(makeCell(v.notes || '-'));
+                frag.appendChild(row);
+            }
+            requestAnimationFrame(() => tbody.replaceChildren(frag));
+        }
+
         // Get actual image dimensions when it loads
-        document.getElementById('main-image').addEventListener('load', function() {
+        $['main-image'].addEventListener('load', function() {
             // The natural dimensions are the original image size
-            if (this.naturalWidth && this.naturalHeight) {
+            if (this.naturalWidth && this.naturalHeight &&
+                (this.naturalWidth !== originalImageWidth || this.naturalHeight !== originalImageHeight)) {
                 originalImageWidth = this.naturalWidth;
                 originalImageHeight = this.naturalHeight;
+                invalidateOverlay();
             }
         });
 
         // Mouse position display in grid mode
         document.querySelector('.image-container').addEventListener('mousemove', function(e) {
-            const posDisplay = document.getElementById('mouse-position');
+            const posDisplay = $['mouse-position'];
             if (!showGrid) {
                 posDisplay.style.display = 'none';
                 return;
             }
 
-            const img = document.getElementById('main-image');
+            const img = $['main-image'];
             const rect = img.getBoundingClientRect();
 
             // Calculate position relative to image
@@ -1748,7 +2060,7 @@ HTML_TEMPLATE = '''
         });
 
         document.querySelector('.image-container').addEventListener('mouseleave', function() {
-            document.getElementById('mouse-position').style.display = 'none';
+            $['mouse-position'].style.display = 'none';
         });
 
         // ============ Re-measure Current Image ============
@@ -1782,11 +2094,7 @@ HTML_TEMPLATE = '''
             .then(data => {
                 if (data.success) {
                     alert('Re-measured! Depth: ' + (data.depth !== null ? data.depth.toFixed(1) + '"' : 'N/A'));
-                    // Reload page but try to stay on same hour
-                    // Store current hour before reload
-                    const currentHour = measurements[currentIndex]?.hour || '12';
-                    sessionStorage.setItem('returnToHour', currentHour);
-                    window.location.reload();
+                    refreshMeasurements();
                 } else {
                     alert('Error: ' + data.error);
                 }
@@ -1796,52 +2104,105 @@ HTML_TEMPLATE = '''
             });
         }
 
+        // Reload the page but try to stay on the same hour
+        function reloadAtCurrentHour() {
+            const currentHour = measurements[currentIndex]?.hour || '12';
+            sessionStorage.setItem('returnToHour', currentHour);
+            window.location.reload();
+        }
+
+        // Re-fetch the day's measurements after a re-measure and patch the
+        // timeline, overlay and summary in place instead of reloading the page.
+        // The whole day is fetched because a changed depth can change the
+        // outlier flags of the readings after it.
+        function refreshMeasurements() {
+            const date = document.getElementById('date').value;
+            return fetch('/api/measurements/' + resort + '/' + date)
+                .then(response => response.json())
+                .then(data => {
+                    const fresh = data.measurements || [];
+                    // Rows were added or switched source (e.g. a filesystem image
+                    // got its first DB row): the timeline itself must be rebuilt
+                    if (fresh.length !== measurements.length ||
+                        fresh.some((m, i) => m.hour !== measurements[i].hour)) {
+                        reloadAtCurrentHour();
+                        return;
+                    }
+                    for (let i = 0, n = fresh.length; i < n; i++) {
+                        const m = fresh[i];
+                        const item = timelineItems[i];
+                        item.className = 'timeline-item ' + m.class + (i === currentIndex ? ' active' : '');
+                        item.title = m.time + ': ' + m.depth;
+                    }
+                    measurements = fresh;
+                    sampleCache.clear();
+                    imageVersion++;
+                    updateDisplay();
+                    loadDailySummary();
+                })
+                .catch(err => {
+                    console.error('Error refreshing measurements:', err);
+                    reloadAtCurrentHour();
+                });
+        }
+
         // ============ Re-measure Modal ============
         function openRemeasureModal() {
-            document.getElementById('remeasure-modal').classList.add('open');
+            $['remeasure-modal'].classList.add('open');
             // Set default date range
             const today = new Date().toISOString().split('T')[0];
             const weekAgo = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000).toISOString().split('T')[0];
-            document.getElementById('remeasure-start').value = weekAgo;
-            document.getElementById('remeasure-end').value = today;
+            $['remeasure-start'].value = weekAgo;
+            $['remeasure-end'].value = today;
             // Reset state
-            document.getElementById('remeasure-progress').classList.remove('active');
-            document.getElementById('remeasure-status').textContent = '';
-            document.getElementById('remeasure-submit').disabled = false;
+            $['remeasure-progress'].classList.remove('active');
+            $['remeasure-status'].textContent = '';
+            $['remeasure-submit'].disabled = false;
             updateRemeasurePreview();
         }
 
         function closeRemeasureModal() {
-            document.getElementById('remeasure-modal').classList.remove('open');
+            $['remeasure-modal'].classList.remove('open');
         }
 
+        const PREVIEW_DEBOUNCE_MS = 400;
+        let previewTimer = null;
+        let previewAbort = null;
+
         function updateRemeasurePreview() {
-            const mode = document.getElementById('remeasure-mode').value;
+            const mode = $['remeasure-mode'].value;
 
             // Show/hide relevant inputs
-            document.getElementById('remeasure-days-row').style.display =
+            $['remeasure-days-row'].style.display =
                 mode === 'last_n_days' ? 'block' : 'none';
-            document.getElementById('remeasure-daterange-row').style.display =
+            $['remeasure-daterange-row'].style.display =
                 mode === 'date_range' ? 'block' : 'none';
 
             // Build preview URL
             let url = '/api/remeasure/' + resort + '/preview?mode=' + mode;
             if (mode === 'last_n_days') {
-                url += '&days=' + document.getElementById('remeasure-days').value;
+                url += '&days=' + $['remeasure-days'].value;
             } else if (mode === 'date_range') {
-                url += '&start_date=' + document.getElementById('remeasure-start').value;
-                url += '&end_date=' + document.getElementById('remeasure-end').value;
+                url += '&start_date=' + $['remeasure-start'].value;
+                url += '&end_date=' + $['remeasure-end'].value;
             }
 
-            // Fetch preview
-            document.getElementById('remeasure-count').textContent = '...';
-            document.getElementById('remeasure-dates').textContent = '';
+            // Fetch preview once the inputs settle, dropping any superseded request
+            $['remeasure-count'].textContent = '...';
+            $['remeasure-dates'].textContent = '';
 
-            fetch(url)
+            clearTimeout(previewTimer);
+            if (previewAbort) previewAbort.abort();
+            previewTimer = setTimeout(() => fetchRemeasurePreview(url), PREVIEW_DEBOUNCE_MS);
+        }
+
+        function fetchRemeasurePreview(url) {
+            previewAbort = new AbortController();
+            fetch(url, { signal: previewAbort.signal })
                 .then(response => response.json())
                 .then(data => {
                     if (data.success) {
-                        document.getElementById('remeasure-count').textContent = data.count;
+                        $['remeasure-count'].textContent = data.count;
                         let dateStr = '';
                         if (data.start_date && data.end_date) {
                             const start = new Date(data.start_date).toLocaleDateString();
@@ -1851,32 +2212,33 @@ HTML_TEMPLATE = '''
                         if (data.calibration_date) {
                             dateStr += ' (calibration: ' + data.calibration_date + ')';
                         }
-                        document.getElementById('remeasure-dates').textContent = dateStr;
+                        $['remeasure-dates'].textContent = dateStr;
                     } else {
-                        document.getElementById('remeasure-count').textContent = '0';
-                        document.getElementById('remeasure-dates').textContent = data.error || data.message || '';
+                        $['remeasure-count'].textContent = '0';
+                        $['remeasure-dates'].textContent = data.error || data.message || '';
                     }
                 })
                 .catch(err => {
-                    document.getElementById('remeasure-count').textContent = 'Error';
-                    document.getElementById('remeasure-dates').textContent = err.toString();
+                    if (err.name === 'AbortError') return;
+                    $['remeasure-count'].textContent = 'Error';
+                    $['remeasure-dates'].textContent = err.toString();
                 });
         }
 
         function executeRemeasure() {
-            const mode = document.getElementById('remeasure-mode').value;
-            const submitBtn = document.getElementById('remeasure-submit');
-            const progressBar = document.getElementById('remeasure-progress');
-            const progressFill = document.getElementById('remeasure-progress-fill');
-            const statusText = document.getElementById('remeasure-status');
-
-            // Build request body
-            let body = { mode: mode };
+            const mode = $['remeasure-mode'].value;
+            const submitBtn = $['remeasure-submit'];
+            const progressBar = $['remeasure-progress'];
+            const progressFill = $['remeasure-progress-fill'];
+            const statusText = $['remeasure-status'];
+
+            // Build request body (streamed so the progress bar can follow along)
+            let body = { mode: mode, stream: true };
             if (mode === 'last_n_days') {
-                body.days = parseInt(document.getElementById('remeasure-days').value);
+                body.days = parseInt($['remeasure-days'].value);
             } else if (mode === 'date_range') {
-                body.start_date = document.getElementById('remeasure-start').value;
-                body.end_date = document.getElementById('remeasure-end').value;
+                body.start_date = $['remeasure-start'].value;
+                body.end_date = $['remeasure-end'].value;
             }
 
             // Show progress
@@ -1886,13 +2248,7 @@ HTML_TEMPLATE = '''
             progressFill.style.width = '10%';
             statusText.textContent = 'Starting re-measurement...';
 
-            fetch('/api/remeasure/' + resort, {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(body)
-            })
-            .then(response => response.json())
-            .then(data => {
+            function finishRemeasure(data) {
                 progressFill.style.width = '100%';
 
                 if (data.success) {
@@ -1900,17 +2256,66 @@ HTML_TEMPLATE = '''
                     statusText.textContent =
                         `Done! ${r.success} succeeded, ${r.failed} failed, ${r.skipped} skipped`;
                     statusText.style.color = '#4ade80';
+                    submitBtn.disabled = false;
+                    submitBtn.textContent = 'Re-measure';
 
-                    // Reload page after short delay to show new measurements
-                    setTimeout(() => {
-                        window.location.reload();
-                    }, 2000);
+                    // Show the new measurements without reloading the page
+                    refreshMeasurements();
+                    if (calibrationMode) updateCalibrationStatus();
                 } else {
                     statusText.textContent = 'Error: ' + data.error;
                     statusText.style.color = '#f87171';
                     submitBtn.disabled = false;
                     submitBtn.textContent = 'Re-measure';
                 }
+            }
+
+            fetch('/api/remeasure/' + resort, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(body)
+            })
+            .then(response => {
+                // Errors before measuring starts still come back as plain JSON
+                const type = response.headers.get('Content-Type') || '';
+                if (!type.startsWith('text/event-stream')) {
+                    return response.json().then(finishRemeasure);
+                }
+
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffered = '';
+                let total = 0;
+                let count = 0;
+                let finished = false;
+                function pump() {
+                    return reader.read().then(({ value, done }) => {
+                        if (done) {
+                            // Server went away before sending its summary
+                            if (!finished) finishRemeasure({ success: false, error: 'stream ended' });
+                            return;
+                        }
+                        buffered += decoder.decode(value, { stream: true });
+                        const events = buffered.split('\\n\\n');
+                        buffered = events.pop();
+                        for (const chunk of events) {
+                            if (!chunk.startsWith('data: ')) continue;
+                            const event = JSON.parse(chunk.slice(6));
+                            if ('total' in event) {
+                                total = event.total;
+                            } else if ('status' in event) {
+                                count++;
+                                progressFill.style.width = (10 + 90 * count / Math.max(total, 1)) + '%';
+                                statusText.textContent = `Processed ${count} of ${total}...`;
+                            } else {
+                                finished = true;
+                                finishRemeasure(event);
+                            }
+                        }
+                        return pump();
+                    });
+                }
+                return pump();
             })
             .catch(err => {
                 progressFill.style.width = '100%';
@@ -1929,7 +2334,7 @@ HTML_TEMPLATE = '''
         });
 
         // Close modal on overlay click
-        document.getElementById('remeasure-modal').addEventListener('click', function(e) {
+        $['remeasure-modal'].addEventListener('click', function(e) {
             if (e.target === this) {
                 closeRemeasureModal();
             }
@@ -1954,50 +2359,207 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
-
-def get_db_connection():
-    """Get database connection."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# Compiled once at import; rendering per request then only runs the template code
+INDEX_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
 
 
-def get_calibration(resort, timestamp=None):
-    """Load calibration for a resort, checking DB versions first.
+class _PooledConnection(sqlite3.Connection):
+    """SQLite connection that goes back to the idle pool instead of closing.
 
-    Args:
-        resort: Resort name
-        timestamp: Optional datetime to get calibration effective at that time.
-                   If None, gets the current calibration.
+    The dev server handles each request on a fresh thread, so connections are
+    pooled process-wide rather than per thread.
     """
-    # First check database for time-based calibration versions
-    try:
-        from db import SnowDatabase
-        db = SnowDatabase(DB_PATH)
-        if timestamp:
-            db_config = db.get_calibration_for_timestamp(resort, timestamp)
-        else:
-            db_config = db.get_current_calibration_version(resort)
-        if db_config:
-            return db_config
-    except Exception as e:
-        pass  # Fall through to file-based config
 
-    # Try per-resort folder structure
-    resorts_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resorts')
-    resort_calibration_path = os.path.join(resorts_dir, resort, 'calibration.json')
+    _checked_out = False
 
-    if os.path.exists(resort_calibration_path):
+    def close(self):
+        if not self._checked_out:
+            return  # Already back in the pool
+        self._checked_out = False
         try:
-            with open(resort_calibration_path) as f:
-                return json.load(f)
-        except:
-            pass
+            if self.in_transaction:
+                self.rollback()
+            _idle_connections.put(self)
+        finally:
+            _open_connections.release()
 
-    # Fallback to old combined config file
-    try:
-        with open(CONFIG_PATH) as f:
-            config = json.load(f)
+
+DB_POOL_SIZE = 8  # most connections checked out at once; further requests wait
+DB_POOL_TIMEOUT = 10  # seconds to wait for a connection before giving up
+
+_idle_connections = queue.SimpleQueue()
+# One permit per connection that may be checked out
+_open_connections = threading.BoundedSemaphore(DB_POOL_SIZE)
+
+
+def get_db_connection():
+    """Get a read-only database connection from the pool.
+
+    At most DB_POOL_SIZE are out at once; when all are, this waits up to
+    DB_POOL_TIMEOUT for one to be returned. Callers must close() it (db_conn()
+    does), which hands it back.
+    """
+    if not _open_connections.acquire(timeout=DB_POOL_TIMEOUT):
+        raise sqlite3.OperationalError('Timed out waiting for a database connection')
+    try:
+        conn = _idle_connections.get_nowait()
+    except queue.Empty:
+        try:
+            conn = _new_pooled_connection()
+        except BaseException:
+            _open_connections.release()
+            raise
+    conn._checked_out = True
+    return conn
+
+
+def _new_pooled_connection():
+    """Open a read-only connection with the pool's pragmas (run once per connection)."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, factory=_PooledConnection)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    # Pooled connections live for the whole process, so give each a larger
+    # page cache (~20 MB) and memory-map the database file (256 MB)
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA mmap_size=268435456')
+    # Sorts and GROUP BYs that spill (daily summaries) stay off disk
+    conn.execute('PRAGMA temp_store=MEMORY')
+    # Pooled connections are for reads; writes go through db_writer() or SnowDatabase
+    conn.execute('PRAGMA query_only=ON')
+    return conn
+
+
+@contextmanager
+def db_conn():
+    """Context manager for a pooled connection, returned to the pool on exit."""
+    conn = get_db_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+# Connection for the frontend's own direct writes (the /api/measure_image
+# upsert); the lock serialises those. Writes made through SnowDatabase
+# (re-measures, calibration saves) use their own connections, so they and
+# db_writer() can still wait on each other's SQLite lock, for up to
+# DB_WRITE_TIMEOUT before SQLITE_BUSY
+DB_WRITE_TIMEOUT = 30  # seconds
+
+_writer_conn = None
+_writer_lock = threading.Lock()
+
+
+@contextmanager
+def db_writer():
+    """Context manager for the write connection; commits on success, rolls back on error."""
+    global _writer_conn
+    with _writer_lock:
+        if _writer_conn is None:
+            _writer_conn = sqlite3.connect(DB_PATH, timeout=DB_WRITE_TIMEOUT,
+                                           check_same_thread=False)
+            _writer_conn.row_factory = sqlite3.Row
+            _writer_conn.execute('PRAGMA journal_mode=WAL')
+            _writer_conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            yield _writer_conn
+            _writer_conn.commit()
+        except Exception:
+            _writer_conn.rollback()
+            raise
+
+
+# Parsed calibration JSON files keyed by path -> (st_mtime_ns, data)
+_json_file_cache = {}
+
+
+def _load_json_cached(path):
+    """Load a JSON file, reusing the parsed result until the file's mtime changes.
+
+    Callers must treat the returned object as read-only.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_file_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path) as f:
+        data = json.load(f)
+    _json_file_cache[path] = (mtime, data)
+    return data
+
+
+CALIBRATION_CACHE_TTL = 60  # seconds; saves through the API invalidate at once
+RESORTS_CACHE_TTL = 60
+
+# resort -> (expires_at, current calibration)
+_calibration_cache = {}
+# (expires_at, resort names) once get_resorts() has run
+_resorts_cache = None
+
+
+def invalidate_calibration_cache(resort):
+    """Drop a resort's cached current calibration after a new version is saved."""
+    _calibration_cache.pop(resort, None)
+
+
+def get_calibration(resort, timestamp=None):
+    """Load calibration for a resort, checking DB versions first.
+
+    The current calibration (no timestamp) is cached for CALIBRATION_CACHE_TTL.
+    Each caller gets its own copy, since the cached and file-backed dicts are
+    shared between request threads.
+
+    Args:
+        resort: Resort name
+        timestamp: Optional datetime to get calibration effective at that time.
+                   If None, gets the current calibration.
+    """
+    if timestamp:
+        return copy.deepcopy(_load_calibration(resort, timestamp))
+
+    now = time.monotonic()
+    cached = _calibration_cache.get(resort)
+    if cached and cached[0] > now:
+        return copy.deepcopy(cached[1])
+    calibration = _load_calibration(resort)
+    _calibration_cache[resort] = (now + CALIBRATION_CACHE_TTL, calibration)
+    return copy.deepcopy(calibration)
+
+
+def _load_calibration(resort, timestamp=None):
+    """Uncached get_calibration()."""
+    # First check database for time-based calibration versions
+    try:
+        from db import SnowDatabase
+        db = SnowDatabase(DB_PATH)
+        if timestamp:
+            db_config = db.get_calibration_for_timestamp(resort, timestamp)
+        else:
+            db_config = db.get_current_calibration_version(resort)
+        if db_config:
+            return db_config
+    except Exception as e:
+        pass  # Fall through to file-based config
+
+    return get_file_calibration(resort)
+
+
+def get_file_calibration(resort):
+    """Load a resort's calibration from its config file, ignoring DB versions."""
+    # Try per-resort folder structure
+    resorts_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resorts')
+    resort_calibration_path = os.path.join(resorts_dir, resort, 'calibration.json')
+
+    if os.path.exists(resort_calibration_path):
+        try:
+            return _load_json_cached(resort_calibration_path)
+        except:
+            pass
+
+    # Fallback to old combined config file
+    try:
+        config = _load_json_cached(CONFIG_PATH)
         for r in config.get('resorts', []):
             if r['resort'] == resort:
                 return r
@@ -2006,7 +2568,45 @@ def get_calibration(resort, timestamp=None):
     return {}
 
 
+def calibration_resolver(db, resort):
+    """Build a timestamp -> calibration lookup over all of a resort's versions.
+
+    Gives the same answer as get_calibration(resort, timestamp), but loads the
+    versions with one query and bisects them per call.
+    """
+    versions = db.get_calibration_timeline(resort)
+    # The database compares timestamps as text in str(datetime) form
+    starts = [v['effective_from'] for v in versions]
+    file_config = None
+
+    def resolve(timestamp):
+        nonlocal file_config
+        ts = str(timestamp)
+        # Latest version that has started and not yet ended, as in
+        # SnowDatabase.get_calibration_for_timestamp()
+        for i in range(bisect.bisect_right(starts, ts) - 1, -1, -1):
+            effective_to = versions[i]['effective_to']
+            if effective_to is None or effective_to > ts:
+                return versions[i]['config']
+        if file_config is None:
+            file_config = get_file_calibration(resort)
+        return file_config
+
+    return resolve
+
+
 def get_resorts():
+    """Get list of configured resorts, cached for RESORTS_CACHE_TTL."""
+    global _resorts_cache
+    now = time.monotonic()
+    if _resorts_cache and _resorts_cache[0] > now:
+        return list(_resorts_cache[1])
+    resorts = _find_resorts()
+    _resorts_cache = (now + RESORTS_CACHE_TTL, resorts)
+    return list(resorts)
+
+
+def _find_resorts():
     """Get list of configured resorts from per-resort folder structure."""
     resorts = []
 
@@ -2022,8 +2622,7 @@ def get_resorts():
 
     # Fallback/merge with old config file
     try:
-        with open(CONFIG_PATH) as f:
-            config = json.load(f)
+        config = _load_json_cached(CONFIG_PATH)
         for r in config.get('resorts', []):
             if r['resort'] not in resorts:
                 resorts.append(r['resort'])
@@ -2043,18 +2642,16 @@ def get_available_dates(resort):
 
     # First check database for measurement dates
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT DISTINCT DATE(timestamp, '-7 hours') as mst_date
-            FROM snow_measurements
-            WHERE resort = ?
-            ORDER BY mst_date DESC
-        ''', (resort,))
-        for row in cursor.fetchall():
+        with db_conn() as conn:
+            rows = conn.execute('''
+                SELECT DISTINCT DATE(timestamp, '-7 hours') as mst_date
+                FROM snow_measurements
+                WHERE resort = ?
+                ORDER BY mst_date DESC
+            ''', (resort,)).fetchall()
+        for row in rows:
             if row[0]:
                 dates.add(row[0])
-        conn.close()
     except:
         pass
 
@@ -2098,9 +2695,11 @@ def get_images_from_filesystem(resort, date_str):
     date_obj = datetime.strptime(date_str, '%Y-%m-%d')
 
     # Pattern for hourly images on this UTC date and next
+    utc_date = date_str.replace('-', '')
+    utc_next_date = (date_obj + timedelta(days=1)).strftime('%Y%m%d')
     patterns = [
-        os.path.join(OUT_DIR, f"{image_prefix}_{date_str.replace('-', '')}*.jpg"),
-        os.path.join(OUT_DIR, f"{image_prefix}_{(date_obj + timedelta(days=1)).strftime('%Y%m%d')}*.jpg"),
+        os.path.join(OUT_DIR, f"{image_prefix}_{utc_date}*.jpg"),
+        os.path.join(OUT_DIR, f"{image_prefix}_{utc_next_date}*.jpg"),
     ]
 
     all_images = []
@@ -2123,24 +2722,25 @@ def get_images_from_filesystem(resort, date_str):
         if minute not in ('00', '01'):
             continue
 
-        # Parse UTC timestamp
-        ts_utc = datetime.strptime(f"{date_part}_{hour}{minute}{second}", "%Y%m%d_%H%M%S")
-        # Convert to MST
-        ts_mst = ts_utc - timedelta(hours=7)
-
-        # Check if this MST date matches requested date
-        if ts_mst.strftime('%Y-%m-%d') != date_str:
+        # Convert the UTC hour to MST (UTC-7) and keep only the requested MST
+        # date: 07-23 UTC on the same date, or 00-06 UTC on the next one
+        utc_hour = int(hour)
+        if date_part == utc_date and utc_hour >= 7:
+            mst_hour = utc_hour - 7
+        elif date_part == utc_next_date and utc_hour < 7:
+            mst_hour = utc_hour + 17
+        else:
             continue
 
         # Skip if we already have this hour
-        hour_key = ts_mst.strftime('%H')
+        hour_key = f"{mst_hour:02d}"
         if hour_key in seen_hours:
             continue
         seen_hours.add(hour_key)
 
         measurements.append({
             'id': f'img_{basename}',
-            'time': ts_mst.strftime('%Y-%m-%d %H:%M'),
+            'time': f"{date_str} {hour_key}:{minute}",
             'hour': hour_key,
             'depth': 'N/A',
             'depth_num': 0,
@@ -2154,11 +2754,26 @@ def get_images_from_filesystem(resort, date_str):
     return sorted(measurements, key=lambda x: x['hour'])
 
 
+MAX_HOURLY_CHANGE = 4.0  # Max inches change per hour before flagging as outlier
+
+# Upper depth bounds (exclusive) for each colour class, checked in order
+DEPTH_CLASSES = ((2, 'low'), (5, 'medium'), (10, 'high'))
+
+
+def _depth_class(depth):
+    """Colour class for a non-outlier depth reading."""
+    for limit, css_class in DEPTH_CLASSES:
+        if depth < limit:
+            return css_class
+    return 'very-high'
+
+
 def get_measurements(resort, date_str):
-    """Get measurements for a resort on a specific date (in MST)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    """Get measurements for a resort on a specific date (in MST).
 
+    Returns:
+        (measurements, stats) where stats holds the day's depth min/max/avg/count
+    """
     # Convert MST date to UTC range for query
     # MST is UTC-7, so MST midnight = UTC 07:00
     # Query for UTC timestamps that fall within the MST day
@@ -2169,74 +2784,81 @@ def get_measurements(resort, date_str):
     next_day = (datetime.strptime(date_str, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
     utc_end = f"{next_day} 06:59:59"  # MST 23:59 in UTC
 
-    cursor.execute('''
-        SELECT id, timestamp, snow_depth_inches, confidence_score, image_path
-        FROM snow_measurements
-        WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
-        ORDER BY timestamp
-    ''', (resort, utc_start, utc_end))
+    with db_conn() as conn:
+        cursor = conn.cursor()
+
+        # Let SQLite shift to MST and format the display strings so the per-row
+        # loop below doesn't need to build datetime objects.
+        cursor.execute('''
+            SELECT id, snow_depth_inches, confidence_score, image_path,
+                   strftime('%Y-%m-%d %H:%M', timestamp, '-7 hours') AS time_mst,
+                   strftime('%H', timestamp, '-7 hours') AS hour_mst,
+                   strftime('%Y%m%d_%H0000', timestamp, '-7 hours') AS stamp_mst
+            FROM snow_measurements
+            WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
+            ORDER BY timestamp
+        ''', (resort, utc_start, utc_end))
 
-    rows = cursor.fetchall()
-    conn.close()
+        rows = cursor.fetchall()
 
-    # If no measurements, fall back to filesystem images
+        # Day statistics over readings with snow, aggregated by SQLite
+        stats = None
+        if rows:
+            cursor.execute('''
+                SELECT MIN(snow_depth_inches), MAX(snow_depth_inches),
+                       AVG(snow_depth_inches), COUNT(*)
+                FROM snow_measurements
+                WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
+                  AND snow_depth_inches > 0
+            ''', (resort, utc_start, utc_end))
+            stats = format_stats(*cursor.fetchone())
+
+    # If no measurements, fall back to filesystem images (which have no depths)
     if not rows:
-        return get_images_from_filesystem(resort, date_str)
+        return get_images_from_filesystem(resort, date_str), format_stats(None, None, None, 0)
 
     measurements = []
+    append = measurements.append
     prev_depth = None
-    MAX_HOURLY_CHANGE = 4.0  # Max inches change per hour before flagging as outlier
 
     for row in rows:
-        measurement_id = row['id']
-        ts_utc = datetime.fromisoformat(row['timestamp'])
-        # Convert UTC to MST (UTC-7)
-        ts = ts_utc - timedelta(hours=7)
         depth = row['snow_depth_inches']
-
-        # Outlier detection
         is_outlier = False
         outlier_reason = None
 
-        if depth is not None and prev_depth is not None:
-            change = abs(depth - prev_depth)
-            if change > MAX_HOURLY_CHANGE:
-                # Check if this could be a stake clearing event
-                if depth < 1.0 and prev_depth > 3.0:
-                    outlier_reason = "stake_cleared"
-                else:
-                    is_outlier = True
-                    outlier_reason = f"spike (+{change:.1f}\")" if depth > prev_depth else f"drop (-{change:.1f}\")"
-
-        # Determine color class based on depth and outlier status
         if depth is None:
             css_class = 'no-data'
             depth_str = 'N/A'
-        elif is_outlier:
-            css_class = 'outlier'
-            depth_str = f"{depth:.1f}\" ⚠️"
-        elif depth < 2:
-            css_class = 'low'
-            depth_str = f"{depth:.1f}\""
-        elif depth < 5:
-            css_class = 'medium'
-            depth_str = f"{depth:.1f}\""
-        elif depth < 10:
-            css_class = 'high'
-            depth_str = f"{depth:.1f}\""
         else:
-            css_class = 'very-high'
             depth_str = f"{depth:.1f}\""
+            # Outlier detection against the last accepted reading. This has to
+            # stay sequential: an outlier doesn't become the next baseline.
+            if prev_depth is not None:
+                change = abs(depth - prev_depth)
+                if change > MAX_HOURLY_CHANGE:
+                    # Check if this could be a stake clearing event
+                    if depth < 1.0 and prev_depth > 3.0:
+                        outlier_reason = "stake_cleared"
+                    else:
+                        is_outlier = True
+                        outlier_reason = f"spike (+{change:.1f}\")" if depth > prev_depth else f"drop (-{change:.1f}\")"
+
+            if is_outlier:
+                css_class = 'outlier'
+                depth_str += " ⚠️"
+            else:
+                css_class = _depth_class(depth)
+                prev_depth = depth
 
         # Get image filename (strip /out/ prefix if present)
-        image_path = row['image_path'] or f"{resort}_{ts.strftime('%Y%m%d_%H0000')}.png"
+        image_path = row['image_path'] or f"{resort}_{row['stamp_mst']}.png"
         if image_path.startswith('/out/'):
             image_path = image_path[5:]  # Remove /out/ prefix
 
-        measurements.append({
-            'id': measurement_id,
-            'time': ts.strftime('%Y-%m-%d %H:%M'),
-            'hour': ts.strftime('%H'),
+        append({
+            'id': row['id'],
+            'time': row['time_mst'],
+            'hour': row['hour_mst'],
             'depth': depth_str,
             'depth_num': depth if depth is not None else 0,
             'confidence': row['confidence_score'],
@@ -2246,25 +2868,66 @@ def get_measurements(resort, date_str):
             'outlier_reason': outlier_reason
         })
 
-        # Update prev_depth for next iteration (only if not an outlier)
-        if depth is not None and not is_outlier:
-            prev_depth = depth
+    return measurements, stats
+
+
+MEASUREMENTS_CACHE_TTL = 30  # seconds; new hourly captures show up within this
+MEASUREMENTS_CACHE_MAX = 64
 
-    return measurements
+# (resort, date_str) -> (expires_at, measurements, stats, measurements_json);
+# shared by the request threads, so only touched under the lock
+_measurements_cache = {}
+_measurements_cache_lock = threading.Lock()
+# resort -> number of invalidations, so a query that raced one isn't cached
+_measurements_generation = {}
 
 
-def calculate_stats(measurements):
-    """Calculate statistics from measurements."""
-    depths = [m['depth_num'] for m in measurements if m['depth_num'] > 0]
+def get_measurements_with_json(resort, date_str):
+    """get_measurements() plus its JSON encoding, cached briefly per resort/date.
 
-    if not depths:
+    Returns (measurements, stats, measurements_json); callers must treat them
+    as read-only.
+    """
+    key = (resort, date_str)
+    now = time.monotonic()
+    with _measurements_cache_lock:
+        cached = _measurements_cache.get(key)
+        generation = _measurements_generation.get(resort, 0)
+    if cached and cached[0] > now:
+        return cached[1:]
+
+    # Queried outside the lock so other resorts/dates aren't held up
+    measurements, stats = get_measurements(resort, date_str)
+    measurements_json = json.dumps(measurements)
+    with _measurements_cache_lock:
+        if _measurements_generation.get(resort, 0) != generation:
+            return measurements, stats, measurements_json
+        _measurements_cache.pop(key, None)
+        _measurements_cache[key] = (now + MEASUREMENTS_CACHE_TTL, measurements, stats, measurements_json)
+        if len(_measurements_cache) > MEASUREMENTS_CACHE_MAX:
+            # Entries are kept in insertion order, so the first is the oldest
+            _measurements_cache.pop(next(iter(_measurements_cache)), None)
+    return measurements, stats, measurements_json
+
+
+def invalidate_measurements_cache(resort):
+    """Drop cached measurements for a resort after its rows change."""
+    with _measurements_cache_lock:
+        _measurements_generation[resort] = _measurements_generation.get(resort, 0) + 1
+        for key in [k for k in list(_measurements_cache) if k[0] == resort]:
+            _measurements_cache.pop(key, None)
+
+
+def format_stats(depth_min, depth_max, depth_avg, count):
+    """Format the day's depth aggregates for display."""
+    if not count:
         return {'min': 'N/A', 'max': 'N/A', 'avg': 'N/A', 'count': 0}
 
     return {
-        'min': f"{min(depths):.1f}",
-        'max': f"{max(depths):.1f}",
-        'avg': f"{sum(depths)/len(depths):.1f}",
-        'count': len(depths)
+        'min': f"{depth_min:.1f}",
+        'max': f"{depth_max:.1f}",
+        'avg': f"{depth_avg:.1f}",
+        'count': count
     }
 
 
@@ -2276,9 +2939,8 @@ def index():
 
     resorts = get_resorts()
     available_dates = get_available_dates(resort)
-    measurements = get_measurements(resort, date_str)
+    measurements, stats, measurements_json = get_measurements_with_json(resort, date_str)
     calibration = get_calibration(resort)
-    stats = calculate_stats(measurements)
 
     # Find current index (latest with data, or middle)
     current_index = len(measurements) - 1 if measurements else 0
@@ -2302,14 +2964,19 @@ def index():
         'is_outlier': False, 'outlier_reason': None
     }
 
-    return render_template_string(
-        HTML_TEMPLATE,
+    # Stream the page so the head and stylesheet reach the browser while the
+    # timeline and script sections are still being rendered.
+    return stream_template(
+        INDEX_TEMPLATE,
         resort=resort,
         resorts=resorts,
         date=date_str,
         available_dates=available_dates,
         measurements=measurements,
-        measurements_json=json.dumps(measurements),
+        measurements_json=measurements_json,
+        static_css=STATIC_CSS,
+        cal_select_html=CAL_SELECT_HTML,
+        remeasure_mode_html=REMEASURE_MODE_HTML,
         stats=stats,
         calibration=cal_display,
         current_index=current_index,
@@ -2322,11 +2989,184 @@ def index():
     )
 
 
+def _encode_jpeg(image, quality=None):
+    """Encode an image as JPEG bytes."""
+    if HAS_TURBOJPEG:
+        # Same defaults as OpenCV: quality 95, 4:2:0 chroma subsampling
+        return _turbojpeg.encode(image, quality=quality if quality is not None else 95,
+                                 pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality] if quality is not None else []
+    _, buffer = cv2.imencode('.jpg', image, params)
+    return buffer.tobytes()
+
+
+def _jpeg_bytes_response(data):
+    """Return already-encoded JPEG bytes as a single-body response.
+
+    The buffer is handed over as bytes with an explicit Content-Length,
+    instead of being wrapped in a BytesIO file object and read back out in
+    chunks by send_file().
+    """
+    response = Response(data, mimetype='image/jpeg', direct_passthrough=True)
+    response.content_length = len(data)
+    return response
+
+
+def _build_placeholder_jpeg():
+    """Render the "Image not found" placeholder once."""
+    img = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    cv2.putText(img, "Image not found", (700, 540),
+               cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+    return _encode_jpeg(img)
+
+
+# The placeholder never changes, so misses don't allocate and encode a frame
+PLACEHOLDER_JPEG = _build_placeholder_jpeg()
+
+
+def _draw_label(img, text, pos, color, font_scale=1.0):
+    """Draw text over a darkened (60% black) background box.
+
+    Blending a black box only changes the pixels inside it, so just that ROI
+    is darkened in place rather than blending a copy of the whole frame.
+    """
+    font = cv2.FONT_HERSHEY_DUPLEX  # Nicer font
+    thickness = 2
+    (tw, th), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+    tx, ty = pos
+    padding = 6
+    bx0, by0 = max(tx - padding, 0), max(ty - th - padding, 0)
+    bx1 = min(tx + tw + padding + 1, img.shape[1])
+    by1 = min(ty + baseline + padding + 1, img.shape[0])
+    if bx1 > bx0 and by1 > by0:
+        box = img[by0:by1, bx0:bx1]
+        box[:] = cv2.addWeighted(np.zeros_like(box), 0.6, box, 0.4, 0)
+    # Draw text with outline for better visibility
+    cv2.putText(img, text, (tx, ty), font, font_scale, (0, 0, 0), thickness + 2)  # Outline
+    cv2.putText(img, text, (tx, ty), font, font_scale, color, thickness)  # Main text
+
+
+RENDERED_IMAGE_CACHE_MAX = 64
+RENDER_CACHE_MAX_FILES = 2000
+RENDER_CACHE_PRUNE_EVERY = 100  # writes between prunes; the cache may overshoot by this many
+
+# Counts writes to the on-disk render cache (next() on it is atomic)
+_render_cache_writes = itertools.count()
+
+# ETag -> encoded JPEG bytes for recently rendered /image responses, least
+# recently used first; shared by the request threads, so only touched under the lock
+_rendered_image_cache = OrderedDict()
+_rendered_image_lock = threading.Lock()
+
+
+def _rendered_image_response(data, etag):
+    """Return rendered JPEG bytes tagged for If-None-Match revalidation."""
+    response = _jpeg_bytes_response(data)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _store_rendered_image(path, data):
+    """Write a rendered JPEG to the on-disk render cache, pruning it now and then.
+
+    The cache is only an optimisation, so any filesystem error is ignored.
+    """
+    tmp_path = None
+    try:
+        os.makedirs(RENDER_CACHE_DIR, exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=RENDER_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return
+
+    # Listing the directory is O(files), so only do it every so many writes
+    # (including the first after a restart)
+    if next(_render_cache_writes) % RENDER_CACHE_PRUNE_EVERY == 0:
+        _prune_render_cache()
+
+
+def _prune_render_cache():
+    """Delete the oldest rendered JPEGs beyond RENDER_CACHE_MAX_FILES."""
+    try:
+        with os.scandir(RENDER_CACHE_DIR) as it:
+            entries = []
+            for entry in it:
+                if entry.name.endswith('.jpg'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass  # Removed by a concurrent prune
+    except OSError:
+        return
+    if len(entries) <= RENDER_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, entry_path in entries[:len(entries) - RENDER_CACHE_MAX_FILES]:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+
+# Sorted PNG filenames in OUT_DIR, rebuilt when the directory's mtime changes
+_png_index = []
+_png_index_mtime = None
+
+
+def _find_png_by_prefix(prefix):
+    """Return the path of the first PNG in OUT_DIR whose name starts with prefix.
+
+    Replaces a per-request glob of OUT_DIR with a bisect over a cached listing.
+    """
+    global _png_index, _png_index_mtime
+    try:
+        mtime = os.stat(OUT_DIR).st_mtime_ns
+    except OSError:
+        return None
+    if mtime != _png_index_mtime:
+        with os.scandir(OUT_DIR) as entries:
+            _png_index = sorted(e.name for e in entries
+                                if e.name.endswith('.png') and not e.name.startswith('.'))
+        _png_index_mtime = mtime
+
+    names = _png_index
+    i = bisect.bisect_left(names, prefix)
+    if i < len(names) and names[i].startswith(prefix):
+        return os.path.join(OUT_DIR, names[i])
+    return None
+
+
+def _measurement_for_image(resort, filename, with_samples=True):
+    """Latest measurement of an image, matched on its file name, or None.
+
+    The stored image_path may be bare, under /out/ or absolute, so only the
+    basename is compared.
+    """
+    sample_column = 'sample_data' if with_samples else 'NULL AS sample_data'
+    with db_conn() as conn:
+        # Match by image filename via idx_resort_image_basename (the unary +
+        # stops SQLite preferring the timestamp index for the ORDER BY)
+        return conn.execute(f'''
+            SELECT snow_depth_inches, {sample_column}, depth_min, depth_max, depth_avg
+            FROM snow_measurements
+            WHERE resort = ? AND image_basename = ?
+            ORDER BY +timestamp DESC LIMIT 1
+        ''', (resort, os.path.basename(filename))).fetchone()
+
+
 @app.route('/image/<resort>/<path:filename>')
 def serve_image(resort, filename):
     """Serve an image with optional calibration overlay."""
-    import glob
-
     # Try to find the image
     image_path = None
 
@@ -2346,142 +3186,87 @@ def serve_image(resort, filename):
             image_path = path
             break
 
-    # If still not found, try pattern matching
+    # If still not found, try any PNG in OUT_DIR starting with the same name
     if not image_path:
         base = os.path.basename(filename).split('.')[0]
-        pattern = os.path.join(OUT_DIR, f"{base}*.png")
-        matches = glob.glob(pattern)
-        if matches:
-            image_path = matches[0]
+        image_path = _find_png_by_prefix(base)
 
     if not image_path or not os.path.exists(image_path):
         # Return a placeholder
-        img = np.zeros((1080, 1920, 3), dtype=np.uint8)
-        cv2.putText(img, "Image not found", (700, 540),
-                   cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
-        _, buffer = cv2.imencode('.jpg', img)
-        return send_file(BytesIO(buffer), mimetype='image/jpeg')
+        response = _jpeg_bytes_response(PLACEHOLDER_JPEG)
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+        return response
+
+    # Get calibration
+    calibration = get_calibration(resort)
+    # Capture time for the MST overlay
+    timestamp_match = _TS_RE.search(os.path.basename(image_path))
+    # Optional output width for previews (never upscaled)
+    max_width = request.args.get('w', type=int)
+
+    # Every other overlay needs a calibration, so with nothing to draw serve
+    # the file as stored rather than decoding and re-encoding it
+    if not calibration and not timestamp_match and not max_width:
+        return send_file(image_path, conditional=True)
+
+    # Check which overlays should be shown
+    show_inches = request.args.get('inches', 'true').lower() != 'false'
+    show_region = request.args.get('region', 'true').lower() != 'false'
+    show_samples = request.args.get('samples', 'true').lower() != 'false'
 
     # Look up snow depth and sample data for this image from database
     snow_depth = None
+    sample_json = None
     sample_data = None
     depth_min = None
     depth_max = None
     depth_avg = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        # Try to match by image path
-        cursor.execute('''
-            SELECT snow_depth_inches, sample_data, depth_min, depth_max, depth_avg
-            FROM snow_measurements
-            WHERE resort = ? AND (image_path LIKE ? OR image_path LIKE ?)
-            ORDER BY timestamp DESC LIMIT 1
-        ''', (resort, f'%{os.path.basename(filename)}', f'%{filename}'))
-        row = cursor.fetchone()
+        # Sample lines are the only overlay that needs the per-sample JSON, so
+        # only fetch and parse it when they will be drawn
+        row = _measurement_for_image(resort, filename, with_samples=show_samples)
         if row:
             snow_depth = row['snow_depth_inches']
             depth_min = row['depth_min']
             depth_max = row['depth_max']
             depth_avg = row['depth_avg']
-            if row['sample_data']:
-                sample_data = json.loads(row['sample_data'])
-        conn.close()
+            sample_json = row['sample_data']
+            if sample_json:
+                sample_data = json.loads(sample_json)
     except Exception as e:
         pass  # Sample data might not exist yet
 
+    # The rendered image is fully determined by the source file, calibration,
+    # measurement and overlay flags, so those make its ETag and cache key.
+    # Other query args (the page's ?v= cache-buster) don't change the render.
+    image_stat = os.stat(image_path)
+    etag = hashlib.md5(json.dumps([
+        image_path, image_stat.st_mtime_ns, image_stat.st_size, calibration,
+        snow_depth, depth_min, depth_max, depth_avg, sample_json,
+        [show_inches, show_region, show_samples, max_width],
+    ], sort_keys=True, default=str).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        return _rendered_image_response(b'', etag)
+    with _rendered_image_lock:
+        cached = _rendered_image_cache.get(etag)
+        if cached is not None:
+            _rendered_image_cache.move_to_end(etag)
+    if cached is not None:
+        return _rendered_image_response(cached, etag)
+    # Renders from before a restart (or evicted from memory) are on disk
+    render_cache_path = os.path.join(RENDER_CACHE_DIR, etag + '.jpg')
+    if os.path.exists(render_cache_path):
+        response = send_file(render_cache_path, mimetype='image/jpeg', etag=etag, conditional=True)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+
     # Load image
     image = cv2.imread(image_path)
     if image is None:
         return "Image load failed", 404
 
-    # Get calibration
-    calibration = get_calibration(resort)
-
-    # Draw coordinate grid for calibration debugging
-    show_grid = request.args.get('grid', 'false').lower() == 'true'
-    if show_grid:
-        img_h, img_w = image.shape[:2]
-        # Vertical lines (X coordinates) every 100 pixels
-        for gx in range(0, img_w, 100):
-            color = (0, 0, 255) if gx % 200 == 0 else (0, 255, 0)
-            thickness = 2 if gx % 200 == 0 else 1
-            cv2.line(image, (gx, 0), (gx, img_h), color, thickness)
-            cv2.putText(image, str(gx), (gx + 3, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 2)
-        # Horizontal lines (Y coordinates) every 100 pixels
-        for gy in range(100, img_h, 100):
-            color = (255, 0, 0) if gy % 200 == 0 else (255, 255, 0)
-            thickness = 2 if gy % 200 == 0 else 1
-            cv2.line(image, (0, gy), (img_w, gy), color, thickness)
-            cv2.putText(image, str(gy), (5, gy - 5), cv2.FONT_HERSHEY_SIMPLEX, 1.0, color, 2)
-
-    # Draw filled regions with 50% opacity
-    show_regions = request.args.get('regions', 'false').lower() == 'true'
-    if show_regions and calibration:
-        overlay = image.copy()
-
-        # Draw stake_corners region (orange fill)
-        stake_corners = calibration.get('stake_corners', {})
-        sc_tl = stake_corners.get('top_left')
-        sc_tr = stake_corners.get('top_right')
-        sc_bl = stake_corners.get('bottom_left')
-        sc_br = stake_corners.get('bottom_right')
-        if all([sc_tl, sc_tr, sc_bl, sc_br]):
-            pts_stake = np.array([sc_tl, sc_tr, sc_br, sc_bl], np.int32)
-            cv2.fillPoly(overlay, [pts_stake], (0, 100, 255))  # Orange (BGR)
-            # Add label
-            center_x = (sc_tl[0] + sc_br[0]) // 2
-            center_y = (sc_tl[1] + sc_br[1]) // 2
-            cv2.putText(overlay, "STAKE", (center_x - 40, center_y),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-
-        # Draw sample_bounds region (green fill)
-        sample_bounds = calibration.get('sample_bounds', {})
-        sb_tl = sample_bounds.get('top_left')
-        sb_tr = sample_bounds.get('top_right')
-        sb_bl = sample_bounds.get('bottom_left')
-        sb_br = sample_bounds.get('bottom_right')
-        if all([sb_tl, sb_tr, sb_bl, sb_br]):
-            pts_base = np.array([sb_tl, sb_tr, sb_br, sb_bl], np.int32)
-            cv2.fillPoly(overlay, [pts_base], (0, 200, 0))  # Green (BGR)
-            # Add label
-            center_x = (sb_tl[0] + sb_br[0]) // 2
-            center_y = (sb_tl[1] + sb_br[1]) // 2
-            cv2.putText(overlay, "BASE", (center_x - 30, center_y),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-
-        # Blend overlay with original image (50% opacity)
-        cv2.addWeighted(overlay, 0.5, image, 0.5, 0, image)
-
-    # Check which overlays should be shown
-    show_inches = request.args.get('inches', 'true').lower() != 'false'
-    show_samples = request.args.get('samples', 'true').lower() != 'false'
-    show_region = request.args.get('region', 'true').lower() != 'false'
-    show_stake = request.args.get('stake', 'false').lower() == 'true'
-    show_base = request.args.get('base', 'false').lower() == 'true'
-
-    # Draw stake boundary if requested (orange)
-    if calibration and show_stake:
-        stake_corners = calibration.get('stake_corners', {})
-        sc_tl = stake_corners.get('top_left')
-        sc_tr = stake_corners.get('top_right')
-        sc_bl = stake_corners.get('bottom_left')
-        sc_br = stake_corners.get('bottom_right')
-        if all([sc_tl, sc_tr, sc_bl, sc_br]):
-            pts_stake = np.array([sc_tl, sc_tr, sc_br, sc_bl], np.int32)
-            cv2.polylines(image, [pts_stake], True, (0, 165, 255), 3)  # Orange
-
-    # Draw base/sample boundary if requested (green)
-    if calibration and show_base:
-        sample_bounds = calibration.get('sample_bounds', {})
-        sb_tl = sample_bounds.get('top_left')
-        sb_tr = sample_bounds.get('top_right')
-        sb_bl = sample_bounds.get('bottom_left')
-        sb_br = sample_bounds.get('bottom_right')
-        if all([sb_tl, sb_tr, sb_bl, sb_br]):
-            pts_base = np.array([sb_tl, sb_tr, sb_br, sb_bl], np.int32)
-            cv2.polylines(image, [pts_base], True, (0, 255, 0), 3)  # Green
-
     # Draw calibration markers
     if calibration:
         import math
@@ -2528,7 +3313,7 @@ def serve_image(resort, filename):
                             cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
 
                 # Draw quadrilateral if all 4 corners defined
-                if all([sb_tl, sb_tr, sb_bl, sb_br]):
+                if sb_tl is not None and sb_tr is not None and sb_bl is not None and sb_br is not None:
                     pts_sample = np.array([sb_tl, sb_tr, sb_br, sb_bl], np.int32)
                     cv2.polylines(image, [pts_sample], True, (255, 255, 0), 2)
 
@@ -2555,7 +3340,8 @@ def serve_image(resort, filename):
             dx_per_dy = math.tan(tilt_rad)
             top_shift = int((h or 0) * dx_per_dy)
 
-            if all([x, y, w, h]):
+            # A 0 x/y is a real coordinate; a 0 width/height means no region
+            if x is not None and y is not None and w and h:
                 # Draw full stake region (outer box, dimmer) - adjusted for tilt
                 pts_outer = np.array([
                     [x + top_shift, y],
@@ -2572,9 +3358,9 @@ def serve_image(resort, filename):
         sb_tr = sample_bounds.get('top_right')
         sb_bl = sample_bounds.get('bottom_left')
         sb_br = sample_bounds.get('bottom_right')
-        has_sample_quad = all([sb_tl, sb_tr, sb_bl, sb_br])
+        has_sample_quad = sb_tl is not None and sb_tr is not None and sb_bl is not None and sb_br is not None
 
-        if all([x, y, w, h]) and centerline_x:
+        if x is not None and y is not None and w and h and centerline_x is not None:
                 # Use sample_bounds if available, otherwise compute from centerline
                 if has_sample_quad:
                     # Use bottom edge of sample quad for base
@@ -2705,17 +3491,17 @@ def serve_image(resort, filename):
                     else:
                         snow_line_y = ref_y if ref_y else y + h
 
-                    for i in range(num_samples):
-                        # Calculate X position along the base
-                        t_x = i / (num_samples - 1) if num_samples > 1 else 0.5
-                        base_x = int(base_left_x + t_x * (base_right_x - base_left_x))
-                        base_y_at_x = int(base_left_y + t_x * (base_right_y - base_left_y))
+                    # Positions evenly spaced along the base, as whole arrays
+                    t_x = np.arange(num_samples) / (num_samples - 1) if num_samples > 1 else np.array([0.5])
+                    base_xs = (base_left_x + t_x * (base_right_x - base_left_x)).astype(np.int32)
+                    base_ys = (base_left_y + t_x * (base_right_y - base_left_y)).astype(np.int32)
 
-                        # Draw line from base to snow line
-                        cv2.line(image,
-                            (base_x, base_y_at_x),
-                            (base_x, snow_line_y),
-                            (255, 150, 50), 1)
+                    # Draw every line from base to snow line in one call
+                    segments = np.empty((num_samples, 2, 2), np.int32)
+                    segments[:, :, 0] = base_xs[:, None]
+                    segments[:, 0, 1] = base_ys
+                    segments[:, 1, 1] = snow_line_y
+                    cv2.polylines(image, list(segments), False, (255, 150, 50), 1)
 
                 # Draw summary stats if available
                 if depth_min is not None and depth_max is not None and depth_avg is not None:
@@ -2728,83 +3514,68 @@ def serve_image(resort, filename):
         ref_y = calibration.get('reference_y')
         ppi = calibration.get('pixels_per_inch', 29.33)
 
-        # Helper function to draw text with background
-        def draw_label(img, text, pos, color, font_scale=1.0):
-            font = cv2.FONT_HERSHEY_DUPLEX  # Nicer font
-            thickness = 2
-            (tw, th), baseline = cv2.getTextSize(text, font, font_scale, thickness)
-            tx, ty = pos
-            # Draw semi-transparent background
-            overlay = img.copy()
-            padding = 6
-            cv2.rectangle(overlay,
-                (tx - padding, ty - th - padding),
-                (tx + tw + padding, ty + baseline + padding),
-                (0, 0, 0), -1)
-            cv2.addWeighted(overlay, 0.6, img, 0.4, 0, img)
-            # Draw text with outline for better visibility
-            cv2.putText(img, text, (tx, ty), font, font_scale, (0, 0, 0), thickness + 2)  # Outline
-            cv2.putText(img, text, (tx, ty), font, font_scale, color, thickness)  # Main text
-
         if x and w and show_inches:
             # For tilted lines: left point and right point have different Y values
             # dy across the width = w * tan(tilt)
             dy_across_width = int(w * dx_per_dy)
 
+            # Marker lines are collected per (colour, thickness) and drawn with
+            # one polylines call each; labels follow in marker order. Labels sit
+            # right of the lines' end, so splitting the two doesn't change what
+            # overlaps what.
+            marker_segments = {}
+            marker_labels = []
+
+            def add_marker(inch, mark_y_left):
+                mark_y_right = mark_y_left + dy_across_width
+                if inch == 0:
+                    # Base/reference line (0") in green
+                    color, thickness, font_scale, label_dy = (0, 255, 0), 3, 1.1, 8
+                elif inch % 4 == 0:
+                    # Every 4 inches - thicker yellow line with larger label
+                    color, thickness, font_scale, label_dy = (0, 255, 255), 2, 0.9, 8
+                else:
+                    # Every 2 inches - thinner cyan line with smaller label
+                    color, thickness, font_scale, label_dy = (0, 200, 200), 1, 0.6, 6
+                marker_segments.setdefault((color, thickness), []).append(
+                    ((x, mark_y_left), (x + w, mark_y_right)))
+                marker_labels.append((f'{inch}"', (x + w + 12, mark_y_right + label_dy), color, font_scale))
+
             if marker_positions:
                 # Use marker_positions for non-linear (distorted) cameras
                 # Draw lines at actual marker Y positions from calibration
                 for inch_str, mark_y in marker_positions.items():
                     inch = int(inch_str)
-                    mark_y_right = mark_y + dy_across_width
-
-                    if inch == 0:
-                        # Base/reference line (0") in green
-                        cv2.line(image, (x, mark_y), (x + w, mark_y_right), (0, 255, 0), 3)
-                        draw_label(image, "0\"", (x + w + 12, mark_y_right + 8), (0, 255, 0), 1.1)
-                    elif inch % 4 == 0:
-                        # Draw every 4 inches in yellow with label
-                        if mark_y > y:
-                            cv2.line(image, (x, mark_y), (x + w, mark_y_right), (0, 255, 255), 2)
-                            draw_label(image, f'{inch}"', (x + w + 12, mark_y_right + 8), (0, 255, 255), 0.9)
-                    else:
-                        # Draw every 2 inches with smaller label
-                        if mark_y > y:
-                            cv2.line(image, (x, mark_y), (x + w, mark_y_right), (0, 200, 200), 1)
-                            draw_label(image, f'{inch}"', (x + w + 12, mark_y_right + 6), (0, 200, 200), 0.6)
+                    if inch == 0 or mark_y > y:
+                        add_marker(inch, mark_y)
 
             elif ref_y:
                 # Use linear pixels_per_inch (for cameras without distortion)
                 # Reference line (0") - tilted
-                cv2.line(image, (x, ref_y), (x + w, ref_y + dy_across_width), (0, 255, 0), 3)
-                draw_label(image, "0\"", (x + w + 12, ref_y + dy_across_width + 8), (0, 255, 0), 1.1)
-
-                # Draw inch markers (tilted) - every 2 inches
-                for inch in range(2, 20, 2):
-                    mark_y_left = int(ref_y - (inch * ppi))
-                    mark_y_right = mark_y_left + dy_across_width
-                    if mark_y_left > y:
-                        if inch % 4 == 0:
-                            # Every 4 inches - thicker yellow line with larger label
-                            cv2.line(image, (x, mark_y_left), (x + w, mark_y_right), (0, 255, 255), 2)
-                            draw_label(image, f'{inch}"', (x + w + 12, mark_y_right + 8), (0, 255, 255), 0.9)
-                        else:
-                            # Every 2 inches - thinner cyan line with smaller label
-                            cv2.line(image, (x, mark_y_left), (x + w, mark_y_right), (0, 200, 200), 1)
-                            draw_label(image, f'{inch}"', (x + w + 12, mark_y_right + 6), (0, 200, 200), 0.6)
+                add_marker(0, ref_y)
+
+                # Inch markers (tilted) every 2 inches, above the region top only
+                inches = np.arange(2, 20, 2)
+                marks_y_left = (ref_y - inches * ppi).astype(np.int32)
+                for inch, mark_y_left in zip(inches[marks_y_left > y].tolist(),
+                                             marks_y_left[marks_y_left > y].tolist()):
+                    add_marker(inch, mark_y_left)
+
+            for (color, thickness), segments in marker_segments.items():
+                cv2.polylines(image, [np.array(seg, np.int32) for seg in segments], False, color, thickness)
+            for text, pos, color, font_scale in marker_labels:
+                _draw_label(image, text, pos, color, font_scale)
 
     # Add MST timestamp overlay on bottom right
     try:
-        # Extract timestamp from filename (e.g., winter_park_20251127_230039.jpg)
-        import re
-        match = re.search(r'(\d{8})_(\d{6})', os.path.basename(image_path))
+        # Extract timestamp from filename
+        match = timestamp_match
         if match:
             date_str, time_str = match.groups()
             # Parse as UTC
-            from datetime import datetime, timedelta
             utc_time = datetime.strptime(f'{date_str}_{time_str}', '%Y%m%d_%H%M%S')
             # Convert to MST (UTC-7)
-            mst_time = utc_time - timedelta(hours=7)
+            mst_time = utc_time - _MST_OFFSET
             timestamp_text = mst_time.strftime('%Y-%m-%d %H:%M MST')
 
             # Draw on bottom right with background
@@ -2824,16 +3595,28 @@ def serve_image(resort, filename):
     except Exception as e:
         pass  # Don't fail if timestamp extraction fails
 
-    # Encode and return
-    _, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 85])
-    return send_file(BytesIO(buffer), mimetype='image/jpeg')
+    # Shrink previews after drawing, so the overlays keep using full-size
+    # image coordinates; the encode then only sees the smaller image
+    img_h, img_w = image.shape[:2]
+    if max_width and 0 < max_width < img_w:
+        image = cv2.resize(image, (max_width, max(1, round(img_h * max_width / img_w))),
+                           interpolation=cv2.INTER_AREA)
+
+    # Encode, remember and return
+    data = _encode_jpeg(image, quality=85)
+    with _rendered_image_lock:
+        _rendered_image_cache[etag] = data
+        _rendered_image_cache.move_to_end(etag)
+        if len(_rendered_image_cache) > RENDERED_IMAGE_CACHE_MAX:
+            _rendered_image_cache.popitem(last=False)
+    _store_rendered_image(render_cache_path, data)
+    return _rendered_image_response(data, etag)
 
 
 @app.route('/api/measurements/<resort>/<date>')
 def api_measurements(resort, date):
     """API endpoint for measurements."""
-    measurements = get_measurements(resort, date)
-    stats = calculate_stats(measurements)
+    measurements, stats = get_measurements(resort, date)
     return jsonify({
         'measurements': measurements,
         'stats': stats
@@ -2844,24 +3627,23 @@ def api_measurements(resort, date):
 def api_samples(measurement_id):
     """API endpoint for sample data for a specific measurement."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT sample_data, depth_min, depth_max, depth_avg, snow_depth_inches
-            FROM snow_measurements WHERE id = ?
-        ''', (measurement_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with db_conn() as conn:
+            row = conn.execute('''
+                SELECT sample_data, depth_min, depth_max, depth_avg, snow_depth_inches
+                FROM snow_measurements WHERE id = ?
+            ''', (measurement_id,)).fetchone()
 
         if row and row['sample_data']:
-            samples = json.loads(row['sample_data'])
-            return jsonify({
-                'samples': samples,
+            # sample_data is already JSON text, so splice it into the body
+            # rather than parsing it only for jsonify to encode it again
+            fields = json.dumps({
                 'depth_min': row['depth_min'],
                 'depth_max': row['depth_max'],
                 'depth_avg': row['depth_avg'],
                 'snow_depth_inches': row['snow_depth_inches']
             })
+            body = '{"samples": ' + row['sample_data'] + ', ' + fields[1:]
+            return Response(body, mimetype='application/json')
         else:
             return jsonify({'samples': []})
     except Exception as e:
@@ -2915,7 +3697,11 @@ def api_get_calibration(resort):
             config = get_calibration(resort)
 
         if config:
-            return jsonify({'success': True, 'calibration': config})
+            response = jsonify({'success': True, 'calibration': config})
+            response.add_etag()
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
         else:
             return jsonify({'success': False, 'error': 'No calibration found'}), 404
 
@@ -2923,44 +3709,185 @@ def api_get_calibration(resort):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@app.route('/api/calibration/<resort>/current', methods=['GET'])
-def api_get_current_calibration(resort):
-    """Get current calibration with ID and effective date."""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        # Only get calibrations where effective_from <= now (not future dates)
-        from datetime import datetime
-        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute('''
-            SELECT id, effective_from, config_json
+def _format_cal_value(val):
+    """Format a calibration value the way the checklist displays it."""
+    if isinstance(val, list):
+        return '[' + ', '.join('' if v is None else _format_cal_value(v) for v in val) + ']'
+    if isinstance(val, bool):
+        return 'true' if val else 'false'
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    return str(val)
+
+
+def calibration_checklist(calibration):
+    """Build the status checklist as [key, label, is_set, value_str] rows."""
+    checklist = []
+    for key, label, parts in _CALIBRATION_POINT_PATHS:
+        val = calibration
+        for part in parts:
+            val = val.get(part) if isinstance(val, dict) else None
+        is_set = val is not None
+        checklist.append([key, label, is_set, _format_cal_value(val) if is_set else ''])
+    return checklist
+
+
+@functools.lru_cache(maxsize=64)
+def _calibration_version_config(calibration_id):
+    """Load the parsed config of a calibration version.
+
+    Saving always inserts a new version, so a version's config never changes
+    and can be cached by ID. Callers must treat it as read-only.
+    """
+    with db_conn() as conn:
+        row = conn.execute('SELECT config_json FROM calibration_versions WHERE id = ?',
+                           (calibration_id,)).fetchone()
+    return json.loads(row['config_json'])
+
+
+def get_current_calibration_payload(resort):
+    """Get the current calibration with its ID, effective date and checklist.
+
+    Returns None if neither the database nor a config file has one.
+    """
+    # Only get calibrations where effective_from <= now (not future dates)
+    from datetime import datetime
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with db_conn() as conn:
+        row = conn.execute('''
+            SELECT id, effective_from
             FROM calibration_versions
             WHERE resort = ? AND effective_from <= ?
             ORDER BY effective_from DESC, id DESC
             LIMIT 1
-        ''', (resort, now_str))
-        row = cursor.fetchone()
-        conn.close()
+        ''', (resort, now_str)).fetchone()
+
+    if row:
+        config = _calibration_version_config(row['id'])
+        return {
+            'id': row['id'],
+            'effective_from': row['effective_from'],
+            'calibration': config,
+            'checklist': calibration_checklist(config)
+        }
 
-        if row:
-            return jsonify({
-                'success': True,
-                'id': row['id'],
-                'effective_from': row['effective_from'],
-                'calibration': json.loads(row['config_json'])
-            })
-        else:
-            # Fall back to file-based config
-            config = get_calibration(resort)
-            if config:
-                return jsonify({
-                    'success': True,
-                    'id': None,
-                    'effective_from': None,
-                    'calibration': config
-                })
+    # Fall back to file-based config
+    config = get_calibration(resort)
+    if config:
+        return {
+            'id': None,
+            'effective_from': None,
+            'calibration': config,
+            'checklist': calibration_checklist(config)
+        }
+    return None
+
+
+def _corner_points(corners):
+    """Return [tl, tr, br, bl] from a corners dict, or None if any is missing."""
+    points = [corners.get(k) for k in ('top_left', 'top_right', 'bottom_right', 'bottom_left')]
+    return points if all(p is not None for p in points) else None
+
+
+def build_overlay_svg(calibration, width, height):
+    """Draw the grid, region fills and stake/base outlines as an SVG.
+
+    These overlays are only drawn here, in image pixel coordinates, not
+    rasterized by serve_image. Each overlay is its own <g class="layer ..."> so
+    the page can show and hide them without fetching a new image.
+    """
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+             f'preserveAspectRatio="none" font-family="sans-serif" font-size="30">']
+
+    # Coordinate grid every 100 pixels, every other line emphasised
+    parts.append('<g class="layer grid">')
+    for gx in range(0, width, 100):
+        color, stroke = ('#f00', 2) if gx % 200 == 0 else ('#0f0', 1)
+        parts.append(f'<line x1="{gx}" y1="0" x2="{gx}" y2="{height}" stroke="{color}" stroke-width="{stroke}"/>'
+                     f'<text x="{gx + 3}" y="50" fill="{color}">{gx}</text>')
+    for gy in range(100, height, 100):
+        color, stroke = ('#00f', 2) if gy % 200 == 0 else ('#0ff', 1)
+        parts.append(f'<line x1="0" y1="{gy}" x2="{width}" y2="{gy}" stroke="{color}" stroke-width="{stroke}"/>'
+                     f'<text x="5" y="{gy - 5}" fill="{color}">{gy}</text>')
+    parts.append('</g>')
+
+    stake = _corner_points(calibration.get('stake_corners') or {})
+    base = _corner_points(calibration.get('sample_bounds') or {})
+
+    # Filled regions at 50% opacity, labelled at the centre of the tl/br diagonal
+    parts.append('<g class="layer regions" opacity="0.5">')
+    for points, fill, label, label_dx in ((stake, '#ff6400', 'STAKE', 40), (base, '#00c800', 'BASE', 30)):
+        if points:
+            pts = ' '.join(f'{x},{y}' for x, y in points)
+            cx = (points[0][0] + points[2][0]) // 2
+            cy = (points[0][1] + points[2][1]) // 2
+            parts.append(f'<polygon points="{pts}" fill="{fill}"/>'
+                         f'<text x="{cx - label_dx}" y="{cy}" fill="#fff" font-size="24">{label}</text>')
+    parts.append('</g>')
+
+    # Stake (orange) and base/sample (green) boundaries
+    for points, stroke, layer in ((stake, '#ffa500', 'stake'), (base, '#0f0', 'base')):
+        parts.append(f'<g class="layer {layer}">')
+        if points:
+            pts = ' '.join(f'{x},{y}' for x, y in points)
+            parts.append(f'<polygon points="{pts}" fill="none" stroke="{stroke}" stroke-width="3"/>')
+        parts.append('</g>')
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+@app.route('/api/calibration/<resort>/overlay.svg', methods=['GET'])
+def api_calibration_overlay(resort):
+    """Get the calibration overlays as an SVG sized to the image (w/h params)."""
+    width = request.args.get('w', 1920, type=int)
+    height = request.args.get('h', 1080, type=int)
+    svg = build_overlay_svg(get_calibration(resort) or {}, width, height)
+    response = Response(svg, mimetype='image/svg+xml')
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@app.route('/api/calibration/<resort>/current', methods=['GET'])
+def api_get_current_calibration(resort):
+    """Get current calibration with ID and effective date."""
+    try:
+        payload = get_current_calibration_payload(resort)
+        if payload:
+            # Calibration rarely changes between polls; let the browser
+            # revalidate with If-None-Match and get a bodiless 304 back
+            response = jsonify({'success': True, **payload})
+            response.add_etag()
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
+        return jsonify({'success': False, 'error': 'No calibration found'}), 404
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/calibration/<resort>/post_save_bundle', methods=['GET'])
+def api_calibration_post_save_bundle(resort):
+    """Get everything the calibration panel refreshes after a save.
+
+    Combines the /current and /history responses so the client makes one
+    request instead of two.
+    """
+    from db import SnowDatabase
+
+    try:
+        limit = request.args.get('limit', 10, type=int)
+        payload = get_current_calibration_payload(resort)
+        if not payload:
             return jsonify({'success': False, 'error': 'No calibration found'}), 404
 
+        db = SnowDatabase(DB_PATH)
+        history = db.get_calibration_versions(resort, limit=limit)
+        return jsonify({'success': True, **payload, 'history': history})
+
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -3020,6 +3947,7 @@ def api_save_calibration(resort):
             notes=notes,
             created_by=created_by
         )
+        invalidate_calibration_cache(resort)
 
         return jsonify({
             'success': True,
@@ -3047,6 +3975,26 @@ def api_calibration_history(resort):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _load_marker_measurer_class():
+    """Load WinterParkMeasurer from resorts/winter_park/measurer.py, or None."""
+    import importlib.util
+
+    measurer_path = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                 'resorts', 'winter_park', 'measurer.py')
+    try:
+        spec = importlib.util.spec_from_file_location("winter_park_measurer", measurer_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.WinterParkMeasurer
+    except Exception as e:
+        print(f"Could not load marker interpolation measurer: {e}, using base measurer")
+        return None
+
+
+# Loaded once at import rather than on every remeasure request
+WinterParkMeasurer = _load_marker_measurer_class()
+
+
 def get_measurer_for_resort(resort, calibration):
     """Get the appropriate measurer for a resort.
 
@@ -3059,16 +4007,9 @@ def get_measurer_for_resort(resort, calibration):
     method = calibration.get('method', 'linear')
     marker_positions = calibration.get('marker_positions', {})
 
-    if method == 'marker_interpolation' or marker_positions:
-        try:
-            import sys
-            if '/app/resorts/winter_park' not in sys.path:
-                sys.path.insert(0, '/app/resorts/winter_park')
-            from measurer import WinterParkMeasurer
-            # WinterParkMeasurer works for any resort with marker_positions
-            return WinterParkMeasurer(calibration)
-        except Exception as e:
-            print(f"Could not load marker interpolation measurer: {e}, using base measurer")
+    if (method == 'marker_interpolation' or marker_positions) and WinterParkMeasurer is not None:
+        # WinterParkMeasurer works for any resort with marker_positions
+        return WinterParkMeasurer(calibration)
 
     # Fall back to base measurer (requires pixels_per_inch)
     return SnowStakeMeasurer(
@@ -3082,20 +4023,16 @@ def api_remeasure_single(resort, measurement_id):
     """Re-measure a single image with current calibration."""
     from db import SnowDatabase
     from measurement import SnowStakeMeasurer
-    import glob
 
     try:
         db = SnowDatabase(DB_PATH)
 
         # Get the measurement
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT id, timestamp, image_path FROM snow_measurements WHERE id = ?',
-            (measurement_id,)
-        )
-        row = cursor.fetchone()
-        conn.close()
+        with db_conn() as conn:
+            row = conn.execute(
+                'SELECT id, timestamp, image_path FROM snow_measurements WHERE id = ?',
+                (measurement_id,)
+            ).fetchone()
 
         if not row:
             return jsonify({'success': False, 'error': 'Measurement not found'}), 404
@@ -3146,6 +4083,7 @@ def api_remeasure_single(resort, measurement_id):
             sample_data=result.samples,
             replace_hourly=True
         )
+        invalidate_measurements_cache(resort)
 
         return jsonify({
             'success': True,
@@ -3201,49 +4139,48 @@ def api_measure_image(resort, image_filename):
         else:
             result = measurer.measure_from_file(actual_path, calibration)
 
-        # Check if measurement already exists
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT id FROM snow_measurements WHERE resort = ? AND image_path = ?',
-            (resort, image_filename)
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing measurement
-            cursor.execute('''
-                UPDATE snow_measurements
-                SET snow_depth_inches = ?, confidence_score = ?, sample_data = ?, notes = ?
-                WHERE id = ?
-            ''', (
-                result.snow_depth_inches,
-                result.confidence_score,
-                json.dumps(_convert_numpy_types(result.samples)) if hasattr(result, 'samples') and result.samples else None,
-                getattr(result, 'notes', ''),
-                existing['id']
-            ))
-            conn.commit()
-            new_id = existing['id']
-        else:
-            # Insert new measurement
-            cursor.execute('''
-                INSERT INTO snow_measurements
-                (resort, timestamp, snow_depth_inches, confidence_score, image_path, sample_data, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                resort,
-                timestamp_str,
-                result.snow_depth_inches,
-                result.confidence_score,
-                image_filename,
-                json.dumps(_convert_numpy_types(result.samples)) if hasattr(result, 'samples') and result.samples else None,
-                getattr(result, 'notes', '')
-            ))
-            conn.commit()
-            new_id = cursor.lastrowid
-
-        conn.close()
+        sample_json = (json.dumps(_convert_numpy_types(result.samples))
+                       if hasattr(result, 'samples') and result.samples else None)
+
+        with db_writer() as conn:
+            # Check if measurement already exists
+            existing = conn.execute(
+                'SELECT id FROM snow_measurements WHERE resort = ? AND image_path = ?',
+                (resort, image_filename)
+            ).fetchone()
+
+            if existing:
+                # Update existing measurement
+                conn.execute('''
+                    UPDATE snow_measurements
+                    SET snow_depth_inches = ?, confidence_score = ?, sample_data = ?, notes = ?
+                    WHERE id = ?
+                ''', (
+                    result.snow_depth_inches,
+                    result.confidence_score,
+                    sample_json,
+                    getattr(result, 'notes', ''),
+                    existing['id']
+                ))
+                new_id = existing['id']
+            else:
+                # Insert new measurement
+                cursor = conn.execute('''
+                    INSERT INTO snow_measurements
+                    (resort, timestamp, snow_depth_inches, confidence_score, image_path, sample_data, notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    resort,
+                    timestamp_str,
+                    result.snow_depth_inches,
+                    result.confidence_score,
+                    image_filename,
+                    sample_json,
+                    getattr(result, 'notes', '')
+                ))
+                new_id = cursor.lastrowid
+
+        invalidate_measurements_cache(resort)
 
         return jsonify({
             'success': True,
@@ -3285,6 +4222,74 @@ def api_calibration_properties(resort):
     return jsonify({'success': True, 'properties': properties})
 
 
+# Rows written per transaction by /api/remeasure, so other writers get a
+# turn between commits on long re-measures
+REMEASURE_COMMIT_EVERY = 100
+# Worker processes shared by all re-measures
+REMEASURE_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_remeasure_executor = None
+_remeasure_executor_lock = threading.Lock()
+# Held while a re-measure runs; a second one is turned away rather than
+# competing for the same workers
+_remeasure_running = threading.Lock()
+
+
+def _get_remeasure_executor():
+    """Process pool for /api/remeasure, started on first use and then reused.
+
+    Workers are spawned rather than forked, so they don't inherit this threaded
+    process's pooled SQLite connections or any lock another thread holds.
+    """
+    global _remeasure_executor
+    with _remeasure_executor_lock:
+        if _remeasure_executor is None:
+            _remeasure_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=REMEASURE_MAX_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return _remeasure_executor
+
+
+def _discard_remeasure_executor(executor):
+    """Forget a broken pool (a worker died) so the next re-measure starts a new one."""
+    global _remeasure_executor
+    with _remeasure_executor_lock:
+        if _remeasure_executor is executor:
+            _remeasure_executor = None
+    executor.shutdown(wait=False)
+
+
+def _remeasure_one(job):
+    """Measure one image for /api/remeasure (runs in a worker process).
+
+    Takes (resort, calibration, image_path) and returns the result fields for
+    insert_measurement(), or {'error': message} if measuring failed.
+    """
+    resort, calibration, image_path = job
+    try:
+        # Create measurer and measure (uses resort-specific measurer if available)
+        measurer = get_measurer_for_resort(resort, calibration)
+
+        # WinterParkMeasurer takes only image path (calibration passed in constructor)
+        if hasattr(measurer, 'measure_from_file') and 'WinterParkMeasurer' in type(measurer).__name__:
+            result = measurer.measure_from_file(image_path)
+        else:
+            result = measurer.measure_from_file(image_path, calibration)
+
+        # Handle both MeasurementResult and WinterParkMeasurement
+        return {
+            'snow_depth_inches': result.snow_depth_inches,
+            'confidence_score': result.confidence_score,
+            'stake_visible': result.stake_visible,
+            'raw_pixel_measurement': getattr(result, 'raw_pixel_measurement', None),
+            'notes': getattr(result, 'notes', ''),
+            'sample_data': result.samples,
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+
 @app.route('/api/remeasure/<resort>', methods=['POST'])
 def api_remeasure(resort):
     """Re-measure snow depths for a resort using current calibration.
@@ -3294,10 +4299,10 @@ def api_remeasure(resort):
     - days: number of days (for 'last_n_days' mode)
     - start_date: ISO date string (for 'date_range' mode)
     - end_date: ISO date string (for 'date_range' mode)
+    - stream: true to get progress as Server-Sent Events instead of one JSON reply
     """
     from db import SnowDatabase
     from measurement import SnowStakeMeasurer
-    import glob
 
     try:
         data = request.get_json() or {}
@@ -3330,14 +4335,11 @@ def api_remeasure(resort):
 
         elif mode == 'all':
             # Get earliest measurement date
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT MIN(timestamp) FROM snow_measurements WHERE resort = ?',
-                (resort,)
-            )
-            row = cursor.fetchone()
-            conn.close()
+            with db_conn() as conn:
+                row = conn.execute(
+                    'SELECT MIN(timestamp) FROM snow_measurements WHERE resort = ?',
+                    (resort,)
+                ).fetchone()
             if row and row[0]:
                 start_date = datetime.fromisoformat(row[0])
             else:
@@ -3348,16 +4350,13 @@ def api_remeasure(resort):
             return jsonify({'success': False, 'error': f'Unknown mode: {mode}'}), 400
 
         # Get all measurements in the date range
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT id, timestamp, image_path
-            FROM snow_measurements
-            WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
-            ORDER BY timestamp
-        ''', (resort, start_date.isoformat(), end_date.isoformat()))
-        measurements = cursor.fetchall()
-        conn.close()
+        with db_conn() as conn:
+            measurements = conn.execute('''
+                SELECT id, timestamp, image_path, image_basename
+                FROM snow_measurements
+                WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
+                ORDER BY timestamp
+            ''', (resort, start_date.isoformat(), end_date.isoformat())).fetchall()
 
         if dry_run:
             return jsonify({
@@ -3369,7 +4368,162 @@ def api_remeasure(resort):
                 'message': f'Would re-measure {len(measurements)} images'
             })
 
-        # Re-measure each image
+        def remeasure_rows():
+            """Re-measure each image, yielding (status, measurement_id, error).
+
+            status is 'skipped', 'failed' or 'success'; error is None on success.
+            """
+            # (measurement_id, timestamp, image_path) and the matching measure job
+            pending = []
+            jobs = []
+
+            # Calibration effective at each measurement's time, from one query
+            calibration_at = calibration_resolver(db, resort)
+
+            # One listing of OUT_DIR answers the usual case (the stored filename
+            # lives in OUT_DIR) without stat calls for every measurement
+            try:
+                with os.scandir(OUT_DIR) as entries:
+                    out_dir_names = {e.name for e in entries}
+            except OSError:
+                out_dir_names = set()
+
+            # Rows unpack positionally, skipping Row's by-name column lookup
+            for measurement_id, timestamp, image_path, image_basename in measurements:
+                timestamp = datetime.fromisoformat(timestamp)
+
+                # Find the actual image file
+                actual_path = None
+                if image_path.startswith('/out/'):
+                    image_path = image_path[5:]
+
+                if image_basename in out_dir_names:
+                    actual_path = os.path.join(OUT_DIR, image_basename)
+                else:
+                    paths_to_try = [
+                        image_path,
+                        os.path.join(OUT_DIR, image_path),
+                        os.path.join(OUT_DIR, os.path.basename(image_path)),
+                    ]
+
+                    for path in paths_to_try:
+                        if os.path.exists(path):
+                            actual_path = path
+                            break
+
+                if not actual_path:
+                    # Try prefix matching against the cached OUT_DIR listing
+                    base = os.path.basename(image_path).split('.')[0]
+                    actual_path = _find_png_by_prefix(base)
+
+                if not actual_path:
+                    yield 'skipped', measurement_id, f'Image not found: {image_path}'
+                    continue
+
+                try:
+                    # Get calibration for this timestamp
+                    calibration = calibration_at(timestamp)
+                    if not calibration:
+                        yield 'failed', measurement_id, 'No calibration for timestamp'
+                        continue
+                except Exception as e:
+                    yield 'failed', measurement_id, str(e)
+                    continue
+
+                pending.append((measurement_id, timestamp, image_path))
+                jobs.append((resort, calibration, actual_path))
+
+            if not jobs:
+                return
+
+            # Measuring is CPU-bound, so fan the images out across processes
+            executor = _get_remeasure_executor()
+            futures = [executor.submit(_remeasure_one, job) for job in jobs]
+            written = 0
+            try:
+
+                # Write each chunk once its images are measured, so the write
+                # lock isn't held while the workers run or while the caller
+                # consumes the statuses
+                for start in range(0, len(pending), REMEASURE_COMMIT_EVERY):
+                    chunk = pending[start:start + REMEASURE_COMMIT_EVERY]
+                    chunk_outcomes = [future.result()
+                                      for future in futures[start:start + REMEASURE_COMMIT_EVERY]]
+                    statuses = []
+                    with db.batch():
+                        for (measurement_id, timestamp, image_path), outcome in \
+                                zip(chunk, chunk_outcomes):
+                            try:
+                                if 'error' in outcome:
+                                    raise Exception(outcome['error'])
+                                # Update the database; a row that fails part way
+                                # is rolled back without undoing the rest of the chunk
+                                with db.savepoint():
+                                    db.delete_measurement(measurement_id)
+                                    db.insert_measurement(
+                                        resort=resort,
+                                        timestamp=timestamp,
+                                        image_path=image_path,
+                                        replace_hourly=True,
+                                        **outcome
+                                    )
+                                statuses.append(('success', measurement_id, None))
+                            except Exception as e:
+                                statuses.append(('failed', measurement_id, str(e)))
+                    # Only reported once committed, so a caller that stops
+                    # listening has seen exactly the rows that were written
+                    written += len(chunk)
+                    yield from statuses
+            except GeneratorExit:
+                app.logger.info("Re-measure of %s abandoned by the client after %d of %d "
+                                "images were written", resort, written, len(jobs))
+                raise
+            except concurrent.futures.process.BrokenProcessPool:
+                _discard_remeasure_executor(executor)
+                raise
+            finally:
+                # Drop the images no worker has started on (a no-op once all are done)
+                for future in futures:
+                    future.cancel()
+                invalidate_measurements_cache(resort)
+
+        if not _remeasure_running.acquire(blocking=False):
+            return jsonify({'success': False, 'error': 'A re-measure is already running'}), 409
+
+        if data.get('stream'):
+            # Server-Sent Events: the total, one event per measurement, then the
+            # same summary the JSON response carries (without the error list)
+            def event_stream():
+                results = {'processed': 0, 'success': 0, 'failed': 0, 'skipped': 0}
+                yield 'data: ' + json.dumps({'total': len(measurements)}) + '\n\n'
+                rows = remeasure_rows()
+                try:
+                    for status, measurement_id, error in rows:
+                        results[status] += 1
+                        event = {'id': measurement_id, 'status': status}
+                        if error:
+                            event['error'] = error
+                        yield 'data: ' + json.dumps(event) + '\n\n'
+                except Exception as e:
+                    yield 'data: ' + json.dumps({'success': False, 'error': str(e)}) + '\n\n'
+                    return
+                finally:
+                    # On a client disconnect this cancels the images still queued
+                    rows.close()
+                results['processed'] = results['success'] + results['failed']
+                yield 'data: ' + json.dumps({
+                    'success': True,
+                    'results': results,
+                    'start_date': start_date.isoformat(),
+                    'end_date': end_date.isoformat()
+                }) + '\n\n'
+
+            response = Response(stream_with_context(event_stream()), mimetype='text/event-stream')
+            response.headers['Cache-Control'] = 'no-cache'
+            # Runs once the stream finishes or the client goes away
+            response.call_on_close(_remeasure_running.release)
+            return response
+
         results = {
             'processed': 0,
             'success': 0,
@@ -3377,89 +4531,17 @@ def api_remeasure(resort):
             'skipped': 0,
             'errors': []
         }
-
-        for m in measurements:
-            measurement_id = m['id']
-            timestamp = datetime.fromisoformat(m['timestamp'])
-            image_path = m['image_path']
-
-            # Find the actual image file
-            actual_path = None
-            if image_path.startswith('/out/'):
-                image_path = image_path[5:]
-
-            paths_to_try = [
-                image_path,
-                os.path.join(OUT_DIR, image_path),
-                os.path.join(OUT_DIR, os.path.basename(image_path)),
-            ]
-
-            for path in paths_to_try:
-                if os.path.exists(path):
-                    actual_path = path
-                    break
-
-            if not actual_path:
-                # Try pattern matching
-                base = os.path.basename(image_path).split('.')[0]
-                pattern = os.path.join(OUT_DIR, f"{base}*.png")
-                matches = glob.glob(pattern)
-                if matches:
-                    actual_path = matches[0]
-
-            if not actual_path:
-                results['skipped'] += 1
-                results['errors'].append({
-                    'id': measurement_id,
-                    'error': f'Image not found: {image_path}'
-                })
-                continue
-
-            results['processed'] += 1
-
-            try:
-                # Get calibration for this timestamp
-                calibration = get_calibration(resort, timestamp)
-                if not calibration:
-                    results['failed'] += 1
+        try:
+            for status, measurement_id, error in remeasure_rows():
+                results[status] += 1
+                if error:
                     results['errors'].append({
                         'id': measurement_id,
-                        'error': 'No calibration for timestamp'
+                        'error': error
                     })
-                    continue
-
-                # Create measurer and measure (uses resort-specific measurer if available)
-                measurer = get_measurer_for_resort(resort, calibration)
-
-                # WinterParkMeasurer takes only image path (calibration passed in constructor)
-                if hasattr(measurer, 'measure_from_file') and 'WinterParkMeasurer' in type(measurer).__name__:
-                    result = measurer.measure_from_file(actual_path)
-                else:
-                    result = measurer.measure_from_file(actual_path, calibration)
-
-                # Update the database (handle both MeasurementResult and WinterParkMeasurement)
-                db.delete_measurement(measurement_id)
-                db.insert_measurement(
-                    resort=resort,
-                    timestamp=timestamp,
-                    image_path=image_path,
-                    snow_depth_inches=result.snow_depth_inches,
-                    confidence_score=result.confidence_score,
-                    stake_visible=result.stake_visible,
-                    raw_pixel_measurement=getattr(result, 'raw_pixel_measurement', None),
-                    notes=getattr(result, 'notes', ''),
-                    sample_data=result.samples,
-                    replace_hourly=True
-                )
-
-                results['success'] += 1
-
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append({
-                    'id': measurement_id,
-                    'error': str(e)
-                })
+        finally:
+            _remeasure_running.release()
+        results['processed'] = results['success'] + results['failed']
 
         return jsonify({
             'success': True,
@@ -3480,68 +4562,66 @@ def api_remeasure(resort):
 @app.route('/api/remeasure/<resort>/preview', methods=['GET'])
 def api_remeasure_preview(resort):
     """Preview how many measurements would be re-processed."""
-    from db import SnowDatabase
-
     try:
         mode = request.args.get('mode', 'since_calibration')
         days = request.args.get('days', 7, type=int)
         start_date_str = request.args.get('start_date')
         end_date_str = request.args.get('end_date')
 
-        db = SnowDatabase(DB_PATH)
-
-        # Determine date range based on mode
-        if mode == 'since_calibration':
-            versions = db.get_calibration_versions(resort, limit=1)
-            if versions:
-                start_date = datetime.fromisoformat(versions[0]['effective_from'])
-                cal_date = start_date.strftime('%Y-%m-%d %H:%M')
-            else:
-                return jsonify({
-                    'success': True,
-                    'count': 0,
-                    'message': 'No calibration versions found'
-                })
-            end_date = datetime.now()
-
-        elif mode == 'last_n_days':
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            cal_date = None
-
-        elif mode == 'date_range':
-            start_date = datetime.fromisoformat(start_date_str)
-            end_date = datetime.fromisoformat(end_date_str)
-            cal_date = None
+        # Every query for the preview shares one pooled connection
+        with db_conn() as conn:
+            # Determine date range based on mode
+            if mode == 'since_calibration':
+                row = conn.execute('''
+                    SELECT effective_from FROM calibration_versions
+                    WHERE resort = ?
+                    ORDER BY effective_from DESC
+                    LIMIT 1
+                ''', (resort,)).fetchone()
+                if row:
+                    start_date = datetime.fromisoformat(row['effective_from'])
+                    cal_date = start_date.strftime('%Y-%m-%d %H:%M')
+                else:
+                    return jsonify({
+                        'success': True,
+                        'count': 0,
+                        'message': 'No calibration versions found'
+                    })
+                end_date = datetime.now()
+
+            elif mode == 'last_n_days':
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=days)
+                cal_date = None
+
+            elif mode == 'date_range':
+                start_date = datetime.fromisoformat(start_date_str)
+                end_date = datetime.fromisoformat(end_date_str)
+                cal_date = None
+
+            elif mode == 'all':
+                # Separate subqueries, because SQLite only reads MIN/MAX straight
+                # off the idx_resort_timestamp edge when each is on its own;
+                # together they scan every row for the resort
+                row = conn.execute('''
+                    SELECT (SELECT MIN(timestamp) FROM snow_measurements WHERE resort = ?1),
+                           (SELECT MAX(timestamp) FROM snow_measurements WHERE resort = ?1)
+                ''', (resort,)).fetchone()
+                if row and row[0]:
+                    start_date = datetime.fromisoformat(row[0])
+                    end_date = datetime.fromisoformat(row[1]) if row[1] else datetime.now()
+                else:
+                    return jsonify({'success': True, 'count': 0, 'message': 'No measurements found'})
+                cal_date = None
 
-        elif mode == 'all':
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT MIN(timestamp), MAX(timestamp) FROM snow_measurements WHERE resort = ?',
-                (resort,)
-            )
-            row = cursor.fetchone()
-            conn.close()
-            if row and row[0]:
-                start_date = datetime.fromisoformat(row[0])
-                end_date = datetime.fromisoformat(row[1]) if row[1] else datetime.now()
             else:
-                return jsonify({'success': True, 'count': 0, 'message': 'No measurements found'})
-            cal_date = None
+                return jsonify({'success': False, 'error': f'Unknown mode: {mode}'}), 400
 
-        else:
-            return jsonify({'success': False, 'error': f'Unknown mode: {mode}'}), 400
-
-        # Count measurements in range
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT COUNT(*) FROM snow_measurements
-            WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
-        ''', (resort, start_date.isoformat(), end_date.isoformat()))
-        count = cursor.fetchone()[0]
-        conn.close()
+            # Count measurements in range
+            count = conn.execute('''
+                SELECT COUNT(*) FROM snow_measurements
+                WHERE resort = ? AND timestamp >= ? AND timestamp <= ?
+            ''', (resort, start_date.isoformat(), end_date.isoformat())).fetchone()[0]
 
         response = {
             'success': True,
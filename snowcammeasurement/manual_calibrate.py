@@ -33,7 +33,9 @@ def get_pixel_coordinates(image_path: str, resort: str):
     if max(h, w) > max_display:
         display_scale = max_display / max(h, w)
 
-    display_image = cv2.resize(image, None, fx=display_scale, fy=display_scale) if display_scale < 1 else image.copy()
+    # Only ever downscales here, so INTER_AREA is both faster and sharper than the default
+    display_image = cv2.resize(image, None, fx=display_scale, fy=display_scale,
+                               interpolation=cv2.INTER_AREA) if display_scale < 1 else image.copy()
 
     clicks = []
 
@@ -0,0 +1,81 @@
+"""Shared fixtures: the frontend app pointed at a temporary database and image folder."""
+
+import os
+import sqlite3
+import sys
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'snowcammeasurement')
+
+# frontend.py and db.py import each other as top-level modules (from db import ...)
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+
+def _reset_frontend_state(module):
+    """Close pooled connections and empty every module-level cache."""
+    while True:
+        try:
+            conn = module._idle_connections.get_nowait()
+        except Exception:
+            break
+        sqlite3.Connection.close(conn)
+    module._open_connections = threading.BoundedSemaphore(module.DB_POOL_SIZE)
+    if module._writer_conn is not None:
+        module._writer_conn.close()
+        module._writer_conn = None
+    module._json_file_cache.clear()
+    module._calibration_cache.clear()
+    module._resorts_cache = None
+    module._measurements_cache.clear()
+    module._measurements_generation.clear()
+    module._rendered_image_cache.clear()
+    module._png_index = []
+    module._png_index_mtime = None
+    module._calibration_version_config.cache_clear()
+
+
+@pytest.fixture
+def frontend(tmp_path, monkeypatch):
+    """The frontend module, using tmp_path for its database, images and render cache."""
+    import frontend as module
+
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+    monkeypatch.setattr(module, 'OUT_DIR', str(out_dir))
+    monkeypatch.setattr(module, 'DB_PATH', str(out_dir / 'snow_measurements.db'))
+    monkeypatch.setattr(module, 'CONFIG_PATH', str(out_dir / 'resort_calibrations.json'))
+    monkeypatch.setattr(module, 'RENDER_CACHE_DIR', str(tmp_path / 'render_cache'))
+    _reset_frontend_state(module)
+    yield module
+    _reset_frontend_state(module)
+
+
+@pytest.fixture
+def db(frontend):
+    """A SnowDatabase on the frontend's temporary database."""
+    from db import SnowDatabase
+    return SnowDatabase(frontend.DB_PATH)
+
+
+@pytest.fixture
+def client(frontend):
+    return frontend.app.test_client()
+
+
+@pytest.fixture
+def write_image(frontend):
+    """Write a small random image into OUT_DIR and return its filename."""
+    rng = np.random.default_rng(0)
+
+    def write(name, size=(120, 160)):
+        cv2.imwrite(os.path.join(frontend.OUT_DIR, name),
+                    rng.integers(0, 255, size + (3,), dtype=np.uint8))
+        return name
+
+    return write
@@ -0,0 +1,142 @@
+"""Tests for SnowDatabase batching and schema setup."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from db import SnowDatabase
+
+
+@pytest.fixture
+def snow_db(tmp_path):
+    return SnowDatabase(str(tmp_path / 'snow.db'))
+
+
+def count_rows(snow_db, table):
+    conn = sqlite3.connect(snow_db.db_path)
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_savepoint_rolls_back_only_the_failed_row(snow_db):
+    kept = snow_db.insert_measurement('r', datetime(2026, 1, 10, 7), 'r_1.png', 3.0)
+    replaced = snow_db.insert_measurement('r', datetime(2026, 1, 10, 8), 'r_2.png', 4.0)
+
+    with snow_db.batch():
+        with snow_db.savepoint():
+            snow_db.delete_measurement(kept)
+            snow_db.insert_measurement('r', datetime(2026, 1, 10, 7), 'r_1.png', 5.0)
+        with pytest.raises(RuntimeError):
+            with snow_db.savepoint():
+                snow_db.delete_measurement(replaced)
+                raise RuntimeError('measure failed after the delete')
+
+    assert snow_db.get_measurement_for_hour('r', datetime(2026, 1, 10, 7))['snow_depth_inches'] == 5.0
+    assert snow_db.get_measurement_for_hour('r', datetime(2026, 1, 10, 8))['id'] == replaced
+    assert count_rows(snow_db, 'snow_measurements') == 2
+
+
+def test_savepoint_outside_batch_is_a_no_op(snow_db):
+    with snow_db.savepoint():
+        snow_db.insert_measurement('r', datetime(2026, 1, 10, 7), 'r_1.png', 3.0)
+
+    assert count_rows(snow_db, 'snow_measurements') == 1
+
+
+@pytest.fixture(params=['generated', 'trigger'])
+def basename_mode(request, monkeypatch):
+    """Run a test against both ways of maintaining image_basename."""
+    import db
+    if request.param == 'generated':
+        if not db._HAS_GENERATED_COLUMNS:
+            pytest.skip('SQLite here is older than 3.31')
+    else:
+        monkeypatch.setattr(db, '_HAS_GENERATED_COLUMNS', False)
+    return request.param
+
+
+def schema(path):
+    conn = sqlite3.connect(path)
+    try:
+        return sorted(conn.execute('SELECT type, name, sql FROM sqlite_master').fetchall(),
+                      key=lambda row: (row[0], row[1]))
+    finally:
+        conn.close()
+
+
+def basenames(path):
+    conn = sqlite3.connect(path)
+    try:
+        return dict(conn.execute('SELECT image_path, image_basename FROM snow_measurements'))
+    finally:
+        conn.close()
+
+
+def test_init_database_is_idempotent(tmp_path, basename_mode):
+    path = str(tmp_path / 'snow.db')
+    SnowDatabase(path)
+    first = schema(path)
+
+    SnowDatabase(path)
+    SnowDatabase(path)
+
+    assert schema(path) == first
+    names = [name for _, name, _ in first]
+    assert 'idx_resort_image_basename' in names
+    triggers = [name for kind, name, _ in first if kind == 'trigger']
+    if basename_mode == 'trigger':
+        assert triggers == ['snow_measurements_image_basename_insert',
+                            'snow_measurements_image_basename_update']
+    else:
+        assert triggers == []
+
+
+def test_image_basename_follows_insert_and_update(tmp_path, basename_mode):
+    snow_db = SnowDatabase(str(tmp_path / 'snow.db'))
+    snow_db.insert_measurement('r', datetime(2026, 1, 10, 7), 'r_1.png', 3.0)
+    snow_db.insert_measurement('r', datetime(2026, 1, 10, 8), '/out/r_2.png', 3.0)
+    moved = snow_db.insert_measurement('r', datetime(2026, 1, 10, 9), '/data/cam/r_3.png', 3.0)
+
+    conn = sqlite3.connect(snow_db.db_path)
+    conn.execute("UPDATE snow_measurements SET image_path = '/archive/r_3b.png' WHERE id = ?",
+                 (moved,))
+    conn.commit()
+    conn.close()
+
+    assert basenames(snow_db.db_path) == {
+        'r_1.png': 'r_1.png',
+        '/out/r_2.png': 'r_2.png',
+        '/archive/r_3b.png': 'r_3b.png',
+    }
+
+
+def test_image_basename_backfills_existing_rows(tmp_path, basename_mode):
+    path = str(tmp_path / 'snow.db')
+    # A database from before the image_basename column existed
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE snow_measurements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resort TEXT NOT NULL,
+            timestamp DATETIME NOT NULL,
+            image_path TEXT NOT NULL,
+            snow_depth_inches REAL,
+            confidence_score REAL,
+            stake_visible BOOLEAN,
+            raw_pixel_measurement INTEGER,
+            notes TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(resort, timestamp)
+        )
+    """)
+    conn.execute("INSERT INTO snow_measurements (resort, timestamp, image_path) "
+                 "VALUES ('r', '2026-01-10 07:00:00', '/out/old.png')")
+    conn.commit()
+    conn.close()
+
+    SnowDatabase(path)
+
+    assert basenames(path) == {'/out/old.png': 'old.png'}
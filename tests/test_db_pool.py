@@ -0,0 +1,47 @@
+"""Tests for the frontend's pooled read-only connections."""
+
+import sqlite3
+import threading
+
+import pytest
+
+
+def test_pooled_connection_rejects_writes(frontend, db):
+    with frontend.db_conn() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO snow_measurements (resort, timestamp, image_filename) "
+                         "VALUES ('r', '2026-01-10 07:00', 'r_1.png')")
+
+
+def test_returned_connection_is_rolled_back_and_reused(frontend, db):
+    conn = frontend.get_db_connection()
+    conn.execute('BEGIN')
+    conn.execute('SELECT COUNT(*) FROM snow_measurements').fetchone()
+    assert conn.in_transaction
+    conn.close()
+
+    again = frontend.get_db_connection()
+    try:
+        assert again is conn
+        assert not again.in_transaction
+    finally:
+        again.close()
+
+
+def test_pool_bounds_open_connections(frontend, db, monkeypatch):
+    monkeypatch.setattr(frontend, '_open_connections', threading.BoundedSemaphore(2))
+    monkeypatch.setattr(frontend, 'DB_POOL_TIMEOUT', 0.05)
+
+    first = frontend.get_db_connection()
+    second = frontend.get_db_connection()
+    with pytest.raises(sqlite3.OperationalError):
+        frontend.get_db_connection()
+
+    first.close()
+    first.close()  # A second close must not free an extra slot
+    third = frontend.get_db_connection()
+    assert third is first
+    with pytest.raises(sqlite3.OperationalError):
+        frontend.get_db_connection()
+    second.close()
+    third.close()
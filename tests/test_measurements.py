@@ -0,0 +1,123 @@
+"""Tests for the day's measurements, their stats and the measurements cache."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+RESORT = 'testresort'
+DATE = '2026-01-10'
+# UTC hour -> depth for one MST day (07:00 UTC is MST midnight)
+DEPTHS = {7: 3.0, 8: 3.5, 9: None, 10: 9.0, 11: 5.0, 12: 0.5, 13: 0.0,
+          14: 6.0, 15: 4.0, 16: 12.0, 17: 7.5, 18: 2.0}
+
+
+def reference_measurements(depths, max_hourly_change=4.0):
+    """The per-row Python computation get_measurements used to do.
+
+    Returns ([(class, is_outlier, outlier_reason)], stats) with stats taken
+    over every reading with snow, outliers included.
+    """
+    flags = []
+    prev_depth = None
+    for depth in depths:
+        is_outlier = False
+        outlier_reason = None
+        if depth is not None and prev_depth is not None:
+            change = abs(depth - prev_depth)
+            if change > max_hourly_change:
+                if depth < 1.0 and prev_depth > 3.0:
+                    outlier_reason = 'stake_cleared'
+                else:
+                    is_outlier = True
+                    outlier_reason = (f"spike (+{change:.1f}\")" if depth > prev_depth
+                                      else f"drop (-{change:.1f}\")")
+        if depth is None:
+            css_class = 'no-data'
+        elif is_outlier:
+            css_class = 'outlier'
+        elif depth < 2:
+            css_class = 'low'
+        elif depth < 5:
+            css_class = 'medium'
+        elif depth < 10:
+            css_class = 'high'
+        else:
+            css_class = 'very-high'
+        flags.append((css_class, is_outlier, outlier_reason))
+        if depth is not None and not is_outlier:
+            prev_depth = depth
+
+    with_snow = [depth for depth in depths if depth]
+    stats = {'min': f'{min(with_snow):.1f}', 'max': f'{max(with_snow):.1f}',
+             'avg': f'{sum(with_snow) / len(with_snow):.1f}', 'count': len(with_snow)}
+    return flags, stats
+
+
+@pytest.fixture
+def known_day(db):
+    for hour, depth in DEPTHS.items():
+        db.insert_measurement(RESORT, datetime(2026, 1, 10, hour),
+                              f'/out/{RESORT}_20260110_{hour:02d}0000.png', depth)
+    # Either side of the MST day
+    db.insert_measurement(RESORT, datetime(2026, 1, 10, 6), f'{RESORT}_20260110_060000.png', 50.0)
+    db.insert_measurement(RESORT, datetime(2026, 1, 11, 7), f'{RESORT}_20260111_070000.png', 50.0)
+
+
+def test_measurements_match_reference(frontend, known_day):
+    measurements, stats = frontend.get_measurements(RESORT, DATE)
+
+    flags, expected_stats = reference_measurements(list(DEPTHS.values()))
+    assert [(m['class'], m['is_outlier'], m['outlier_reason']) for m in measurements] == flags
+    assert stats == expected_stats
+    assert [m['hour'] for m in measurements] == [f'{hour - 7:02d}' for hour in DEPTHS]
+    assert measurements[0]['image'] == f'{RESORT}_20260110_070000.png'
+
+
+def test_reference_day_covers_every_outlier_kind():
+    flags, _ = reference_measurements(list(DEPTHS.values()))
+    reasons = {reason.split()[0] for _, _, reason in flags if reason}
+    assert reasons == {'spike', 'drop', 'stake_cleared'}
+
+
+@pytest.fixture
+def measurer(frontend, db, monkeypatch):
+    """A calibrated resort whose measurer always reads 7 inches."""
+    db.save_calibration_version(RESORT, datetime(2025, 1, 1), {'enabled': True})
+    result = SimpleNamespace(snow_depth_inches=7.0, confidence_score=0.9, stake_visible=True,
+                             notes='', samples=None)
+    fake = SimpleNamespace(measure_from_file=lambda *args: result)
+    monkeypatch.setattr(frontend, 'get_measurer_for_resort', lambda resort, calibration: fake)
+
+
+def cached_keys(frontend):
+    with frontend._measurements_cache_lock:
+        return set(frontend._measurements_cache)
+
+
+def test_remeasure_single_invalidates_cache(frontend, known_day, measurer, write_image, client):
+    write_image(f'{RESORT}_20260110_080000.png')
+    frontend.get_measurements_with_json(RESORT, DATE)
+    assert (RESORT, DATE) in cached_keys(frontend)
+    measurement_id = next(m['id'] for m in frontend.get_measurements(RESORT, DATE)[0]
+                          if m['hour'] == '01')
+
+    response = client.post(f'/api/remeasure_single/{RESORT}/{measurement_id}', json={})
+
+    assert response.get_json()['success'] is True
+    assert (RESORT, DATE) not in cached_keys(frontend)
+    measurements, _, _ = frontend.get_measurements_with_json(RESORT, DATE)
+    assert next(m for m in measurements if m['hour'] == '01')['depth_num'] == 7.0
+
+
+def test_measure_image_invalidates_cache(frontend, known_day, measurer, write_image, client):
+    name = write_image(f'{RESORT}_20260110_190000.jpg')
+    frontend.get_measurements_with_json(RESORT, DATE)
+    assert (RESORT, DATE) in cached_keys(frontend)
+
+    response = client.post(f'/api/measure_image/{RESORT}/{name}', json={})
+
+    assert response.get_json()['success'] is True
+    assert (RESORT, DATE) not in cached_keys(frontend)
+    measurements, _, _ = frontend.get_measurements_with_json(RESORT, DATE)
+    assert measurements[-1]['image'] == name
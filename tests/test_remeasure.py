@@ -0,0 +1,82 @@
+"""Tests for /api/remeasure, including its Server-Sent Events stream."""
+
+import concurrent.futures
+import json
+import logging
+from datetime import datetime
+
+import pytest
+
+RESORT = 'testresort'
+BODY = {'mode': 'date_range', 'start_date': '2026-01-09', 'end_date': '2026-01-11'}
+
+
+@pytest.fixture
+def remeasure(frontend, db, write_image, monkeypatch):
+    """Five stored measurements and a stand-in measurer running on a thread pool."""
+    db.save_calibration_version(RESORT, datetime(2025, 1, 1), {'pixels_per_inch': 10.0})
+    for hour in range(7, 12):
+        name = write_image(f'{RESORT}_20260110_{hour:02d}0000.png')
+        db.insert_measurement(RESORT, datetime(2026, 1, 10, hour), '/out/' + name, 1.0)
+
+    def measure(job):
+        return {'snow_depth_inches': 2.0, 'confidence_score': 0.5, 'stake_visible': True,
+                'raw_pixel_measurement': None, 'notes': '', 'sample_data': None}
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(frontend, '_remeasure_one', measure)
+    monkeypatch.setattr(frontend, '_get_remeasure_executor', lambda: executor)
+    monkeypatch.setattr(frontend, 'REMEASURE_COMMIT_EVERY', 2)
+    yield frontend
+    executor.shutdown(wait=True)
+
+
+def parse_events(body):
+    return [json.loads(chunk[len('data: '):]) for chunk in body.split('\n\n') if chunk]
+
+
+def test_json_response(remeasure, client):
+    response = client.post(f'/api/remeasure/{RESORT}', json=BODY)
+
+    results = response.get_json()['results']
+    assert (results['processed'], results['success'], results['failed']) == (5, 5, 0)
+
+
+def test_stream_event_order(remeasure, client):
+    # The WSGI server closes the response once it has been sent
+    with client.post(f'/api/remeasure/{RESORT}', json=dict(BODY, stream=True)) as response:
+        assert response.mimetype == 'text/event-stream'
+        events = parse_events(response.get_data(as_text=True))
+
+    assert events[0] == {'total': 5}
+    assert [event['status'] for event in events[1:-1]] == ['success'] * 5
+    assert events[-1]['success'] is True
+    assert events[-1]['results'] == {'processed': 5, 'success': 5, 'failed': 0, 'skipped': 0}
+    assert not remeasure._remeasure_running.locked()
+
+
+def test_stream_disconnect_releases_the_endpoint(remeasure, client, caplog):
+    caplog.set_level(logging.INFO, logger=remeasure.app.logger.name)
+    response = client.post(f'/api/remeasure/{RESORT}', json=dict(BODY, stream=True),
+                           buffered=False)
+    chunks = iter(response.response)
+    assert parse_events(next(chunks).decode()) == [{'total': 5}]
+    assert parse_events(next(chunks).decode())[0]['status'] == 'success'
+
+    # The client goes away part way through
+    response.close()
+
+    assert not remeasure._remeasure_running.locked()
+    assert 'abandoned by the client after 2 of 5' in caplog.text
+    assert client.post(f'/api/remeasure/{RESORT}', json=BODY).status_code == 200
+
+
+def test_concurrent_remeasure_is_refused(remeasure, client):
+    assert remeasure._remeasure_running.acquire(blocking=False)
+    try:
+        response = client.post(f'/api/remeasure/{RESORT}', json=BODY)
+    finally:
+        remeasure._remeasure_running.release()
+
+    assert response.status_code == 409
+    assert response.get_json()['success'] is False
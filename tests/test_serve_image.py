@@ -0,0 +1,117 @@
+"""Tests for /image rendering and its ETag / render caches."""
+
+import os
+from datetime import datetime
+
+
+IMAGE = 'testresort_20260110_070000.png'
+
+
+def count_renders(frontend, monkeypatch):
+    """Wrap _encode_jpeg so the test can see how many images were rendered."""
+    calls = []
+    encode = frontend._encode_jpeg
+
+    def counting_encode(image, quality=None):
+        calls.append(image.shape)
+        return encode(image, quality=quality)
+
+    monkeypatch.setattr(frontend, '_encode_jpeg', counting_encode)
+    return calls
+
+
+def test_cache_buster_does_not_change_render(frontend, client, write_image, monkeypatch):
+    write_image(IMAGE)
+    renders = count_renders(frontend, monkeypatch)
+
+    first = client.get(f'/image/testresort/{IMAGE}?v=1')
+    second = client.get(f'/image/testresort/{IMAGE}?v=2')
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert len(renders) == 1
+    assert len(os.listdir(frontend.RENDER_CACHE_DIR)) == 1
+
+
+def test_overlay_flags_change_render(frontend, client, write_image, monkeypatch):
+    write_image(IMAGE)
+    renders = count_renders(frontend, monkeypatch)
+
+    plain = client.get(f'/image/testresort/{IMAGE}')
+    preview = client.get(f'/image/testresort/{IMAGE}?w=80')
+
+    assert plain.headers['ETag'] != preview.headers['ETag']
+    assert len(renders) == 2
+
+
+def test_svg_only_overlays_do_not_change_render(frontend, client, write_image, monkeypatch):
+    # The grid, regions, stake and base overlays are drawn by overlay.svg
+    write_image(IMAGE)
+    renders = count_renders(frontend, monkeypatch)
+
+    plain = client.get(f'/image/testresort/{IMAGE}')
+    flagged = client.get(f'/image/testresort/{IMAGE}?grid=true&regions=true&stake=true&base=true')
+
+    assert plain.headers['ETag'] == flagged.headers['ETag']
+    assert len(renders) == 1
+
+
+def test_overlay_svg_keeps_corners_at_zero(frontend):
+    corners = {'top_left': [0, 0], 'top_right': [100, 0],
+               'bottom_right': [100, 200], 'bottom_left': [0, 200]}
+
+    assert frontend._corner_points(corners) == [[0, 0], [100, 0], [100, 200], [0, 200]]
+    assert frontend._corner_points(dict(corners, top_left=None)) is None
+    svg = frontend.build_overlay_svg({'stake_corners': corners}, 320, 240)
+    assert '<polygon points="0,0 100,0 100,200 0,200" fill="none"' in svg
+
+
+def test_revalidation_returns_304(client, write_image):
+    write_image(IMAGE)
+    etag = client.get(f'/image/testresort/{IMAGE}?v=1').headers['ETag']
+
+    response = client.get(f'/image/testresort/{IMAGE}?v=2', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+
+
+def test_render_cache_survives_restart(frontend, client, write_image, monkeypatch):
+    write_image(IMAGE)
+    etag = client.get(f'/image/testresort/{IMAGE}?v=1').headers['ETag']
+    # A restart loses the in-memory cache but not the files on disk
+    frontend._rendered_image_cache.clear()
+    renders = count_renders(frontend, monkeypatch)
+
+    response = client.get(f'/image/testresort/{IMAGE}?v=2')
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] == etag
+    assert renders == []
+
+
+def test_measurement_lookup_matches_on_basename(frontend, db):
+    db.insert_measurement('testresort', datetime(2026, 1, 10, 7), '/out/' + IMAGE, 3.0,
+                          sample_data=[{'sample_index': 0, 'depth_inches': 3.0}])
+    db.insert_measurement('testresort', datetime(2026, 1, 10, 8),
+                          '/data/cam/testresort_20260110_080000.png', 5.0)
+    db.insert_measurement('other', datetime(2026, 1, 10, 7), IMAGE, 9.0)
+
+    row = frontend._measurement_for_image('testresort', IMAGE)
+    assert row['snow_depth_inches'] == 3.0
+    assert row['sample_data'] is not None
+    # Requests may carry the /out/ prefix or any directory
+    assert frontend._measurement_for_image(
+        'testresort', '/out/testresort_20260110_080000.png')['snow_depth_inches'] == 5.0
+    assert frontend._measurement_for_image('testresort', IMAGE,
+                                           with_samples=False)['sample_data'] is None
+    assert frontend._measurement_for_image('testresort', 'testresort_nope.png') is None
+
+
+def test_serve_image_uses_the_measurement(frontend, client, db, write_image):
+    write_image(IMAGE)
+    without = client.get(f'/image/testresort/{IMAGE}').headers['ETag']
+
+    db.insert_measurement('testresort', datetime(2026, 1, 10, 7), '/out/' + IMAGE, 3.0)
+    with_measurement = client.get(f'/image/testresort/{IMAGE}').headers['ETag']
+
+    assert with_measurement != without